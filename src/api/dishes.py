@@ -1,44 +1,69 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Depends, Response, status, Query
+from fastapi.responses import ORJSONResponse
 from beanie import PydanticObjectId
+from functools import partial
 from typing import List, Optional
 
-from models.dish import Dish, DishCreate, DishUpdate, DishResponse, DishStatus
-from models.commons import MealType
-from services.dish_service import dish_service, DishService
+from models.dish import Dish, DishCreate, DishUpdate, DishResponse, DishStatusValue
+from models.commons import MealTypeValue
+from services.dish_service import dish_service
+from services.menu_schedule_service import MenuScheduleService
+from services.nutritional_analysis_service import NutritionalAnalysisService
 from core.dependencies import require_list, require_read, require_update, require_create, require_delete
+from core.config import settings
+from core.responses import model_response, stream_models
+from utils.cache import TTLCache
 
 router = APIRouter(
     tags=["Dishes"],
     responses={404: {"description": "Not found"}},
 )
 
+def _to_response(dish: Dish) -> DishResponse:
+    """Build a response from a stored dish without re-validating it."""
+    return DishResponse.model_construct(**dict(dish))
+
+# Serialized GET / responses keyed by filters; cleared on every dish write
+_dish_list_cache = TTLCache(ttl=settings.LIST_CACHE_TTL_SECONDS)
+
+_require_create_dep = Depends(require_create())
+_require_read_dep = Depends(require_read())
+_require_list_dep = Depends(require_list())
+_require_update_dep = Depends(require_update())
+_require_delete_dep = Depends(require_delete())
+
 @router.get("/", response_model=List[DishResponse], summary="Get all dishes with filtering")
 async def get_all_dishes(
-    name: Optional[str] = Query(None, description="Filter by dish name (case-insensitive substring match)"),
-    status: Optional[DishStatus] = Query(None, description="Filter by dish status"),
-    meal_type: Optional[MealType] = Query(None, description="Filter by compatible meal type"),
-    service: DishService = Depends(lambda: dish_service),
-    current_user: dict = Depends(require_list()),
-):
+    name: Optional[str] = Query(None, description="Filter by dish name (case-insensitive): names starting with it or containing it as whole words"),
+    status: Optional[DishStatusValue] = Query(None, description="Filter by dish status"),
+    meal_type: Optional[MealTypeValue] = Query(None, description="Filter by compatible meal type"),
+    current_user: dict = _require_list_dep,
+) -> Response:
     """
     Retrieve a list of all dishes, with optional filters for name, status, and meal type.
     """
-    return await service.get_all_dishes(name=name, status=status, meal_type=meal_type)
+    cache_key = (name, status, meal_type)
+    body = _dish_list_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    return await stream_models(
+        dish_service.stream_dishes(name=name, status=status, meal_type=meal_type),
+        DishResponse,
+        on_complete=partial(_dish_list_cache.set, cache_key, generation=_dish_list_cache.generation),
+    )
 
 @router.get("/{dish_id}", response_model=DishResponse, summary="Get a single dish by ID")
 async def get_dish(
     dish_id: PydanticObjectId,
-    service: DishService = Depends(lambda: dish_service),
-    current_user: dict = Depends(require_read()),
-):
+    current_user: dict = _require_read_dep,
+) -> Response:
     """
     Retrieve the details of a single dish by its unique ID.
     """
-    dish = await service.get_dish(dish_id)
+    dish = await dish_service.get_dish(dish_id)
     if not dish:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dish not found")
-    return dish
+    return model_response(_to_response(dish), DishResponse)
 
 @router.post(
     "/",
@@ -48,8 +73,7 @@ async def get_dish(
 )
 async def create_dish(
     dish_data: DishCreate,
-    service: DishService = Depends(lambda: dish_service),
-    current_user: dict = Depends(require_create()),
+    current_user: dict = _require_create_dep,
 ):
     """
     Create a new dish with nutritional information and a recipe.
@@ -57,7 +81,9 @@ async def create_dish(
     - **recipe**: List of ingredients and their quantities. All ingredients must exist and be active.
     """
     try:
-        return await service.create_dish(dish_data)
+        dish = await dish_service.create_dish(dish_data)
+        _dish_list_cache.clear()
+        return dish
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except HTTPException:
@@ -74,16 +100,18 @@ async def create_dish(
 async def update_dish(
     dish_id: PydanticObjectId,
     dish_data: DishUpdate,
-    service: DishService = Depends(lambda: dish_service),
-    current_user: dict = Depends(require_update()),
+    current_user: dict = _require_update_dep,
 ):
     """
     Update an existing dish's properties, including its recipe.
     """
     try:
-        updated_dish = await service.update_dish(dish_id, dish_data)
+        updated_dish = await dish_service.update_dish(dish_id, dish_data)
         if not updated_dish:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dish not found")
+        _dish_list_cache.clear()
+        NutritionalAnalysisService.clear_report_cache()
+        MenuScheduleService.clear_citizen_menu_cache()
         return updated_dish
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -100,9 +128,8 @@ async def update_dish(
 )
 async def delete_dish(
     dish_id: PydanticObjectId,
-    service: DishService = Depends(lambda: dish_service),
-    current_user: dict = Depends(require_delete()),
-) -> JSONResponse:
+    current_user: dict = _require_delete_dep,
+) -> ORJSONResponse:
     """
     Delete a dish.
     
@@ -121,8 +148,11 @@ async def delete_dish(
     - Confirmation message with details of the deleted dish
     """
     try:
-        result = await service.delete_dish(dish_id)
-        return JSONResponse(
+        result = await dish_service.delete_dish(dish_id)
+        _dish_list_cache.clear()
+        NutritionalAnalysisService.clear_report_cache()
+        MenuScheduleService.clear_citizen_menu_cache()
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content=result
         )
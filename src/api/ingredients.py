@@ -1,19 +1,69 @@
 # pae_menus/api/ingredients.py
-from typing import List, Optional
-from fastapi import APIRouter, Query, HTTPException, status, Depends
-from fastapi.responses import JSONResponse, Response
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+from fastapi import APIRouter, Query, HTTPException, Request, status, Depends
+from fastapi.responses import ORJSONResponse, Response
+
+from beanie import PydanticObjectId
 
 from models.ingredient import (
     IngredientCreate, 
     IngredientUpdate, 
     IngredientResponse,
     IngredientDetailedResponse,
-    IngredientStatus
+    IngredientStatus,
+    IngredientStatusValue
 )
 from services.ingredient_service import IngredientService
+from services.nutritional_analysis_service import NutritionalAnalysisService
 from core.dependencies import require_create, require_list, require_update, require_delete, require_read  
+from core.config import settings
+from core.responses import etag_response, model_response, stream_models, tag_body
+from utils.cache import TTLCache
 router = APIRouter()
 
+# Serialized list responses and their ETags keyed by endpoint and query parameters; cleared on every write
+_ingredient_list_cache = TTLCache(ttl=settings.LIST_CACHE_TTL_SECONDS)
+
+
+async def _cached_ingredient_list(
+    cache_key: tuple,
+    open_stream,
+    request: Request,
+    item_type: Any = IngredientResponse,
+) -> Response:
+    """Serve a cached ingredient list body, streaming it from the database and caching it on a miss"""
+    tagged_body = _ingredient_list_cache.get(cache_key)
+    if tagged_body is not None:
+        return etag_response(tagged_body, request)
+    # A write while the list streams clears the cache; don't store the old body then
+    generation = _ingredient_list_cache.generation
+    return await stream_models(
+        open_stream(),
+        item_type,
+        on_complete=lambda body: _ingredient_list_cache.set(cache_key, tag_body(body), generation=generation),
+        exclude_none=True,
+    )
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Turn a comma-separated `fields` value into the stored field names to project"""
+    if not fields:
+        return None
+    stored_names = {}
+    for name, field in IngredientResponse.model_fields.items():
+        stored_names[name] = stored_names[field.alias or name] = field.alias or name
+    selected = {"_id"}
+    for name in fields.split(","):
+        name = name.strip()
+        if name not in stored_names:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown ingredient field: '{name}'"
+            )
+        selected.add(stored_names[name])
+    return tuple(sorted(selected))
+
 
 @router.post(
     "/",
@@ -25,7 +75,7 @@ router = APIRouter()
 async def create_ingredient(
     ingredient_data: IngredientCreate,
     current_user: dict = Depends(require_create()),
-) -> IngredientResponse:
+) -> Response:
     """
     Create a new ingredient.
     
@@ -36,7 +86,9 @@ async def create_ingredient(
     - **category**: Optional category
     """
     ingredient = await IngredientService.create_ingredient(ingredient_data)
-    return ingredient
+    _ingredient_list_cache.clear()
+    NutritionalAnalysisService.clear_report_cache()
+    return model_response(ingredient, IngredientResponse, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -46,33 +98,60 @@ async def create_ingredient(
     description="Retrieve all ingredients with optional filtering and pagination. Use '/active' endpoint for menu creation to exclude inactive ingredients.",
 )
 async def get_ingredients(
+    request: Request,
     current_user: dict = Depends(require_list()),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    status: Optional[IngredientStatus] = Query(None, description="Filter by ingredient status"),
+    status: Optional[IngredientStatusValue] = Query(None, description="Filter by ingredient status"),
     category: Optional[str] = Query(None, description="Filter by ingredient category"),
-    search: Optional[str] = Query(None, description="Search term for ingredient name")
-) -> List[IngredientResponse]:
+    search: Optional[str] = Query(None, description="Search term for ingredient name"),
+    after_id: Optional[PydanticObjectId] = Query(None, description="Cursor: return ingredients after this ID (takes precedence over skip)"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. name,base_unit_of_measure,status")
+) -> Response:
     """
     Get all ingredients with optional filtering.
     
     This endpoint returns both active and inactive ingredients based on filtering.
     For menu creation, use the '/active' endpoint instead to exclude inactive ingredients.
     
+    Optional fields without a value (description, category) are left out of each item.
+    The list is streamed from the database cursor. Once cached, it carries an
+    ETag; send it back in If-None-Match to get an empty 304 Not Modified while
+    the list is unchanged.
+    
     - **skip**: Number of records to skip for pagination
     - **limit**: Maximum number of records to return
     - **status**: Filter by ingredient status (active/inactive). Leave empty to get all.
     - **category**: Filter by ingredient category
-    - **search**: Search term for ingredient name (case-insensitive)
+    - **search**: Search term for ingredient name (case-insensitive); matches names
+      starting with it or containing it as whole words
+    - **after_id**: Cursor for keyset pagination: the `_id` of the last
+      ingredient of the previous page
+    - **fields**: Only return these fields of each ingredient (the `_id` is
+      always included); leave empty to get every field
     """
-    ingredients = await IngredientService.get_all_ingredients(
+    selected_fields = _parse_fields(fields)
+    filters = dict(
         skip=skip,
         limit=limit,
-        status_filter=status.value if status else None,
+        status_filter=status,
         category_filter=category,
-        search=search
+        search=search,
+        after_id=after_id
+    )
+    cache_key = ("all", skip, limit, status, category, search, after_id, selected_fields)
+    if selected_fields:
+        return await _cached_ingredient_list(
+            cache_key,
+            partial(IngredientService.stream_ingredient_fields, selected_fields, **filters),
+            request,
+            item_type=Dict[str, Any],
+        )
+    return await _cached_ingredient_list(
+        cache_key,
+        partial(IngredientService.stream_ingredients, **filters),
+        request,
     )
-    return ingredients
 
 
 @router.get(
@@ -82,30 +161,46 @@ async def get_ingredients(
     description="Retrieve only active ingredients available for creating new menus. Inactive ingredients are excluded.",
 )
 async def get_active_ingredients(
+    request: Request,
     current_user: dict = Depends(require_list()),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     category: Optional[str] = Query(None, description="Filter by ingredient category"),
-    search: Optional[str] = Query(None, description="Search term for ingredient name")
-) -> List[IngredientResponse]:
+    search: Optional[str] = Query(None, description="Search term for ingredient name"),
+    after_id: Optional[PydanticObjectId] = Query(None, description="Cursor: return ingredients after this ID (takes precedence over skip)")
+) -> Response:
     """
     Get only active ingredients for menu creation.
     
     This endpoint specifically filters out inactive ingredients to ensure
     they don't appear when creating new menus, implementing the soft deletion logic.
     
+    Optional fields without a value (description, category) are left out of each item.
+    The list is streamed from the database cursor. Once cached, it carries an
+    ETag; send it back in If-None-Match to get an empty 304 Not Modified while
+    the list is unchanged.
+    
     - **skip**: Number of records to skip for pagination
     - **limit**: Maximum number of records to return
     - **category**: Filter by ingredient category
-    - **search**: Search term for ingredient name (case-insensitive)
+    - **search**: Search term for ingredient name (case-insensitive); matches names
+      starting with it or containing it as whole words
+    - **after_id**: Cursor for keyset pagination: the `_id` of the last
+      ingredient of the previous page
     """
-    ingredients = await IngredientService.get_active_ingredients(
-        skip=skip,
-        limit=limit,
-        category_filter=category,
-        search=search
+    return await _cached_ingredient_list(
+        ("active", skip, limit, category, search, after_id),
+        partial(
+            IngredientService.stream_ingredients,
+            status_filter=IngredientStatus.ACTIVE.value,
+            skip=skip,
+            limit=limit,
+            category_filter=category,
+            search=search,
+            after_id=after_id
+        ),
+        request,
     )
-    return ingredients
 
 
 @router.get(
@@ -118,10 +213,10 @@ async def get_detailed_ingredients(
     current_user: dict = Depends(require_list()),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    status: Optional[IngredientStatus] = Query(None, description="Filter by ingredient status"),
+    status: Optional[IngredientStatusValue] = Query(None, description="Filter by ingredient status"),
     category: Optional[str] = Query(None, description="Filter by ingredient category"),
     search: Optional[str] = Query(None, description="Search term for ingredient name")
-) -> List[IngredientDetailedResponse]:
+) -> Response:
     """
     Get detailed ingredients with menu usage information.
     
@@ -137,16 +232,17 @@ async def get_detailed_ingredients(
     - **limit**: Maximum number of records to return
     - **status**: Filter by ingredient status (active/inactive)
     - **category**: Filter by ingredient category
-    - **search**: Search term for ingredient name (case-insensitive)
+    - **search**: Search term for ingredient name (case-insensitive); matches names
+      starting with it or containing it as whole words
     """
     ingredients = await IngredientService.get_detailed_ingredients(
         skip=skip,
         limit=limit,
-        status_filter=status.value if status else None,
+        status_filter=status,
         category_filter=category,
         search=search
     )
-    return ingredients
+    return model_response(ingredients, List[IngredientDetailedResponse])
 
 
 @router.get(
@@ -175,7 +271,7 @@ async def get_ingredient_categories(
 )
 async def get_ingredient_statistics(
     current_user: dict = Depends(require_list()),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Get comprehensive ingredient statistics.
     
@@ -188,7 +284,7 @@ async def get_ingredient_statistics(
     Perfect for dashboard summary views.
     """
     stats = await IngredientService.get_ingredient_statistics()
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_200_OK,
         content=stats
     )
@@ -239,14 +335,14 @@ async def check_name_uniqueness(
 )
 async def get_ingredient(ingredient_id: str,
     current_user: dict = Depends(require_read()),
-) -> IngredientResponse:
+) -> Response:
     """
     Get a specific ingredient by ID.
     
     - **ingredient_id**: The unique identifier of the ingredient
     """
     ingredient = await IngredientService.get_ingredient_by_id(ingredient_id)
-    return ingredient
+    return model_response(ingredient, IngredientResponse)
 
 
 @router.get(
@@ -257,7 +353,7 @@ async def get_ingredient(ingredient_id: str,
 )
 async def get_detailed_ingredient(ingredient_id: str,
     current_user: dict = Depends(require_list()),
-) -> IngredientDetailedResponse:
+) -> Response:
     """
     Get a specific ingredient with detailed menu usage information.
     
@@ -270,7 +366,7 @@ async def get_detailed_ingredient(ingredient_id: str,
     - **ingredient_id**: The unique identifier of the ingredient
     """
     ingredient = await IngredientService.get_detailed_ingredient_by_id(ingredient_id)
-    return ingredient
+    return model_response(ingredient, IngredientDetailedResponse)
 
 
 @router.put(
@@ -283,7 +379,7 @@ async def update_ingredient(
     ingredient_id: str, 
     ingredient_data: IngredientUpdate,
     current_user: dict = Depends(require_update()),
-) -> IngredientResponse:
+) -> Response:
     """
     Update an existing ingredient.
     
@@ -295,7 +391,9 @@ async def update_ingredient(
     - **category**: New category
     """
     ingredient = await IngredientService.update_ingredient(ingredient_id, ingredient_data)
-    return ingredient
+    _ingredient_list_cache.clear()
+    NutritionalAnalysisService.clear_report_cache()
+    return model_response(ingredient, IngredientResponse)
 
 
 @router.delete(
@@ -305,14 +403,16 @@ async def update_ingredient(
 )
 async def delete_ingredient(ingredient_id: str,
     current_user: dict = Depends(require_delete()),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Delete an ingredient.
     
     - **ingredient_id**: The unique identifier of the ingredient to delete
     """
     result = await IngredientService.delete_ingredient(ingredient_id)
-    return JSONResponse(
+    _ingredient_list_cache.clear()
+    NutritionalAnalysisService.clear_report_cache()
+    return ORJSONResponse(
         status_code=status.HTTP_200_OK,
         content=result
     )
@@ -326,7 +426,7 @@ async def delete_ingredient(ingredient_id: str,
 )
 async def inactivate_ingredient(ingredient_id: str,
     current_user: dict = Depends(require_update()),
-) -> IngredientResponse:
+) -> Response:
     """
     Inactivate an ingredient (soft delete).
     
@@ -339,7 +439,9 @@ async def inactivate_ingredient(ingredient_id: str,
     - **ingredient_id**: The unique identifier of the ingredient to inactivate
     """
     ingredient = await IngredientService.inactivate_ingredient(ingredient_id)
-    return ingredient
+    _ingredient_list_cache.clear()
+    NutritionalAnalysisService.clear_report_cache()
+    return model_response(ingredient, IngredientResponse)
 
 
 @router.patch(
@@ -350,7 +452,7 @@ async def inactivate_ingredient(ingredient_id: str,
 )
 async def activate_ingredient(ingredient_id: str,
     current_user: dict = Depends(require_update()),
-) -> IngredientResponse:
+) -> Response:
     """
     Activate an ingredient.
     
@@ -362,4 +464,6 @@ async def activate_ingredient(ingredient_id: str,
     - **ingredient_id**: The unique identifier of the ingredient to activate
     """
     ingredient = await IngredientService.activate_ingredient(ingredient_id)
-    return ingredient 
\ No newline at end of file
+    _ingredient_list_cache.clear()
+    NutritionalAnalysisService.clear_report_cache()
+    return model_response(ingredient, IngredientResponse) 
\ No newline at end of file
@@ -1,15 +1,37 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, Response, status, Query
+from beanie import PydanticObjectId
+from functools import partial
 from typing import List, Optional
 
 from models.menu_cycle import MenuCycleCreate, MenuCycleUpdate, MenuCycleResponse, MenuCycleStatus
 from services.menu_cycle_service import menu_cycle_service, MenuCycleService
+from services.menu_schedule_service import MenuScheduleService
+from services.nutritional_analysis_service import NutritionalAnalysisService
 from core.dependencies import require_create, require_list, require_update, require_delete, require_read
+from core.config import settings
+from core.responses import model_response, stream_models
+from utils.cache import TTLCache
 
 router = APIRouter(
     tags=["Menu Cycles"],
     responses={404: {"description": "Not found"}},
 )
 
+
+async def get_menu_cycle_service() -> MenuCycleService:
+    """Return the shared MenuCycleService instance."""
+    return menu_cycle_service
+
+# Serialized GET / responses keyed by query parameters; cleared on every menu cycle write
+_menu_cycle_list_cache = TTLCache(ttl=settings.LIST_CACHE_TTL_SECONDS)
+
+_menu_cycle_service_dep = Depends(get_menu_cycle_service)
+_require_create_dep = Depends(require_create())
+_require_read_dep = Depends(require_read())
+_require_list_dep = Depends(require_list())
+_require_update_dep = Depends(require_update())
+_require_delete_dep = Depends(require_delete())
+
 @router.post(
     "/",
     response_model=MenuCycleResponse,
@@ -19,9 +41,9 @@ router = APIRouter(
 )
 async def create_menu_cycle(
     menu_cycle_data: MenuCycleCreate,
-    service: MenuCycleService = Depends(lambda: menu_cycle_service),
-    current_user: dict = Depends(require_create()),
-) -> MenuCycleResponse:
+    service: MenuCycleService = _menu_cycle_service_dep,
+    current_user: dict = _require_create_dep,
+) -> Response:
     """
     Create a new menu cycle.
     
@@ -37,7 +59,9 @@ async def create_menu_cycle(
     
     - **menu_cycle_data**: The menu cycle data to create
     """
-    return await service.create_menu_cycle(menu_cycle_data)
+    menu_cycle = await service.create_menu_cycle(menu_cycle_data)
+    _menu_cycle_list_cache.clear()
+    return model_response(menu_cycle, MenuCycleResponse, status_code=status.HTTP_201_CREATED)
 
 @router.get(
     "/",
@@ -50,14 +74,15 @@ async def get_all_menu_cycles(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     status: Optional[MenuCycleStatus] = Query(None, description="Filter by menu cycle status"),
     search: Optional[str] = Query(None, description="Search term for menu cycle name"),
-    service: MenuCycleService = Depends(lambda: menu_cycle_service),
-    current_user: dict = Depends(require_list()),
-) -> List[MenuCycleResponse]:
+    after_id: Optional[PydanticObjectId] = Query(None, description="Cursor: return menu cycles after this ID (takes precedence over skip)"),
+    service: MenuCycleService = _menu_cycle_service_dep,
+    current_user: dict = _require_list_dep,
+) -> Response:
     """
     Get all menu cycles with optional filtering.
     
-    This endpoint returns menu cycles based on filtering criteria:
-    - Pagination (skip/limit)
+    This endpoint returns menu cycles ordered by ID based on filtering criteria:
+    - Pagination (skip/limit, or after_id/limit)
     - Status filter (active/inactive)
     - Name search
     
@@ -65,12 +90,24 @@ async def get_all_menu_cycles(
     - **limit**: Maximum number of records to return
     - **status**: Filter by menu cycle status
     - **search**: Search term for menu cycle name (case-insensitive)
+    - **after_id**: Cursor for keyset pagination: the `_id` of the last
+      menu cycle of the previous page
     """
-    return await service.get_all_menu_cycles(
+    cache_key = (skip, limit, status, search, after_id)
+    body = _menu_cycle_list_cache.get(cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    menu_cycles = service.stream_menu_cycles(
         skip=skip,
         limit=limit,
         status_filter=status.value if status else None,
-        search=search
+        search=search,
+        after_id=after_id
+    )
+    return await stream_models(
+        menu_cycles,
+        MenuCycleResponse,
+        on_complete=partial(_menu_cycle_list_cache.set, cache_key, generation=_menu_cycle_list_cache.generation),
     )
 
 @router.get(
@@ -81,9 +118,9 @@ async def get_all_menu_cycles(
 )
 async def get_menu_cycle(
     menu_cycle_id: str,
-    service: MenuCycleService = Depends(lambda: menu_cycle_service),
-    current_user: dict = Depends(require_read()),
-) -> MenuCycleResponse:
+    service: MenuCycleService = _menu_cycle_service_dep,
+    current_user: dict = _require_read_dep,
+) -> Response:
     """
     Get a specific menu cycle by ID.
     
@@ -94,7 +131,8 @@ async def get_menu_cycle(
     
     - **menu_cycle_id**: The unique identifier of the menu cycle
     """
-    return await service.get_menu_cycle_by_id(menu_cycle_id)
+    menu_cycle = await service.get_menu_cycle_by_id(menu_cycle_id)
+    return model_response(menu_cycle, MenuCycleResponse)
 
 @router.patch(
     "/{menu_cycle_id}",
@@ -105,9 +143,9 @@ async def get_menu_cycle(
 async def update_menu_cycle(
     menu_cycle_id: str,
     menu_cycle_data: MenuCycleUpdate,
-    service: MenuCycleService = Depends(lambda: menu_cycle_service),
-    current_user: dict = Depends(require_update()),
-) -> MenuCycleResponse:
+    service: MenuCycleService = _menu_cycle_service_dep,
+    current_user: dict = _require_update_dep,
+) -> Response:
     """
     Update a menu cycle.
     
@@ -124,7 +162,11 @@ async def update_menu_cycle(
     - **menu_cycle_id**: The unique identifier of the menu cycle to update
     - **menu_cycle_data**: The update data
     """
-    return await service.update_menu_cycle(menu_cycle_id, menu_cycle_data)
+    menu_cycle = await service.update_menu_cycle(menu_cycle_id, menu_cycle_data)
+    _menu_cycle_list_cache.clear()
+    NutritionalAnalysisService.clear_report_cache()
+    MenuScheduleService.clear_citizen_menu_cache()
+    return model_response(menu_cycle, MenuCycleResponse)
 
 @router.patch(
     "/{menu_cycle_id}/deactivate",
@@ -134,9 +176,9 @@ async def update_menu_cycle(
 )
 async def deactivate_menu_cycle(
     menu_cycle_id: str,
-    service: MenuCycleService = Depends(lambda: menu_cycle_service),
-    current_user: dict = Depends(require_delete()),
-) -> MenuCycleResponse:
+    service: MenuCycleService = _menu_cycle_service_dep,
+    current_user: dict = _require_delete_dep,
+) -> Response:
     """
     Deactivate a menu cycle.
     
@@ -147,7 +189,11 @@ async def deactivate_menu_cycle(
     
     - **menu_cycle_id**: The unique identifier of the menu cycle to deactivate
     """
-    return await service.deactivate_menu_cycle(menu_cycle_id)
+    menu_cycle = await service.deactivate_menu_cycle(menu_cycle_id)
+    _menu_cycle_list_cache.clear()
+    NutritionalAnalysisService.clear_report_cache()
+    MenuScheduleService.clear_citizen_menu_cache()
+    return model_response(menu_cycle, MenuCycleResponse)
 
 @router.delete(
     "/{menu_cycle_id}",
@@ -156,8 +202,8 @@ async def deactivate_menu_cycle(
 )
 async def delete_menu_cycle(
     menu_cycle_id: str,
-    service: MenuCycleService = Depends(lambda: menu_cycle_service),
-    current_user: dict = Depends(require_delete()),
+    service: MenuCycleService = _menu_cycle_service_dep,
+    current_user: dict = _require_delete_dep,
 ) -> dict:
     """
     Delete a menu cycle.
@@ -176,4 +222,8 @@ async def delete_menu_cycle(
     Returns:
     - Confirmation message with details of the deleted menu cycle
     """
-    return await service.delete_menu_cycle(menu_cycle_id) 
\ No newline at end of file
+    result = await service.delete_menu_cycle(menu_cycle_id)
+    _menu_cycle_list_cache.clear()
+    NutritionalAnalysisService.clear_report_cache()
+    MenuScheduleService.clear_citizen_menu_cache()
+    return result 
\ No newline at end of file
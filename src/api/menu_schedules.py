@@ -1,26 +1,51 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Query
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Path, Request, Response, status, Query
+from typing import Annotated, List, Optional, Union
 from datetime import date
+from beanie import PydanticObjectId
 
 from models.menu_schedule import (
     MenuScheduleAssignmentRequest,
     MenuScheduleAssignmentSummary,
     MenuScheduleResponse,
+    MenuScheduleListItem,
     MenuScheduleUpdate,
     MenuScheduleStatus,
     CitizenMenuResponse,
     LocationType,
     ScheduleDetailedResponse
 )
+from models.commons import OBJECT_ID_PATTERN
 from services.menu_schedule_service import menu_schedule_service, MenuScheduleService
-from services.coverage_service import coverage_service, CoverageService
+from services.nutritional_analysis_service import NutritionalAnalysisService
 from core.dependencies import require_create, require_list, require_update, require_delete, require_read
+from core.config import settings
+from core.responses import (
+    etag_response, model_response, not_modified, serialize_model, stream_models, tag_body, version_tag
+)
+from utils.cache import TTLCache
 
 router = APIRouter(
     tags=["Menu Schedules"],
     responses={404: {"description": "Not found"}},
 )
 
+# Malformed IDs are rejected with a 422 before any database work
+_ScheduleId = Annotated[str, Path(pattern=OBJECT_ID_PATTERN, description="Menu schedule ID")]
+
+# Serialized schedule lists and their ETags keyed by query parameters; cleared on every schedule write
+_schedule_list_cache = TTLCache(ttl=settings.SCHEDULE_LIST_CACHE_TTL_SECONDS)
+# Serialized citizen menus and their ETags keyed by location and date; cleared on every
+# schedule, menu cycle and dish write
+_citizen_menu_cache = MenuScheduleService.citizen_menu_cache
+# Last good citizen menus, served marked as stale when the lookup fails
+_citizen_menu_fallback = TTLCache(ttl=settings.CITIZEN_MENU_STALE_TTL_SECONDS, maxsize=4096)
+
+_require_create_dep = Depends(require_create())
+_require_read_dep = Depends(require_read())
+_require_list_dep = Depends(require_list())
+_require_update_dep = Depends(require_update())
+_require_delete_dep = Depends(require_delete())
+
 @router.post(
     "/assign",
     response_model=MenuScheduleAssignmentSummary,
@@ -30,9 +55,9 @@ router = APIRouter(
 )
 async def assign_menu_cycle(
     assignment_request: MenuScheduleAssignmentRequest,
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_create()),
-) -> MenuScheduleAssignmentSummary:
+    background_tasks: BackgroundTasks,
+    current_user: dict = _require_create_dep,
+) -> Response:
     """
     Assign a menu cycle to locations for a date range.
     
@@ -50,16 +75,23 @@ async def assign_menu_cycle(
     - end_date: Assignment end date
     
     Returns a summary with assigned locations, dates, and the created schedule ID.
+    The schedule's nutritional report is built in the background once the
+    response is sent, so the first report request is served from the cache.
     """
-    return await service.assign_menu_cycle(assignment_request)
+    result = await menu_schedule_service.assign_menu_cycle(assignment_request)
+    _schedule_list_cache.clear()
+    MenuScheduleService.clear_citizen_menu_cache()
+    background_tasks.add_task(NutritionalAnalysisService.warm_report_cache, result.schedule_id)
+    return model_response(result, MenuScheduleAssignmentSummary, status_code=status.HTTP_201_CREATED)
 
 @router.get(
     "/",
-    response_model=List[MenuScheduleResponse],
+    response_model=Union[List[MenuScheduleResponse], List[MenuScheduleListItem]],
     summary="Get all menu schedules",
     description="Retrieve all menu schedules with optional filtering and pagination."
 )
 async def get_all_schedules(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     status: Optional[MenuScheduleStatus] = Query(None, description="Filter by schedule status"),
@@ -70,9 +102,10 @@ async def get_all_schedules(
     start_date_to: Optional[date] = Query(None, description="Filter schedules starting up to this date"),
     end_date_from: Optional[date] = Query(None, description="Filter schedules ending from this date"),
     end_date_to: Optional[date] = Query(None, description="Filter schedules ending up to this date"),
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_list()),
-) -> List[MenuScheduleResponse]:
+    after_id: Optional[PydanticObjectId] = Query(None, description="Cursor: return schedules after this ID (takes precedence over skip)"),
+    compact: bool = Query(False, description="Return compact list items without coverage and cancellation details"),
+    current_user: dict = _require_list_dep,
+) -> Response:
     """
     Get all menu schedules with enhanced filtering for administrators.
     
@@ -91,19 +124,43 @@ async def get_all_schedules(
     **location_type**: Filter by location type (campus/town)
     **start_date_from/to**: Filter by schedule start date range
     **end_date_from/to**: Filter by schedule end date range
+    **after_id**: Cursor for keyset pagination: the `_id` of the last schedule
+    of the previous page (schedules are listed newest first)
+    **compact**: Return only id, menu cycle, dates, status and last update of
+    each schedule, for list views
+    
+    The list is streamed from the database cursor. Once cached, it carries an
+    ETag; send it back in If-None-Match to get an empty 304 Not Modified while
+    the list is unchanged.
     """
-    location_type_value = location_type.value if location_type else None
-    return await service.get_all_schedules(
+    cache_key = (
+        skip, limit, status, menu_cycle_id, location_id, location_type,
+        start_date_from, start_date_to, end_date_from, end_date_to, after_id, compact
+    )
+    tagged_body = _schedule_list_cache.get(cache_key)
+    if tagged_body is not None:
+        return etag_response(tagged_body, request)
+    
+    # A write while the list streams clears the cache; don't store the old body then
+    generation = _schedule_list_cache.generation
+    schedules = menu_schedule_service.stream_schedules(
         skip=skip,
         limit=limit,
         status_filter=status,
         menu_cycle_id=menu_cycle_id,
         location_id=location_id,
-        location_type=location_type_value,
+        location_type=location_type,
         start_date_from=start_date_from,
         start_date_to=start_date_to,
         end_date_from=end_date_from,
-        end_date_to=end_date_to
+        end_date_to=end_date_to,
+        after_id=after_id,
+        compact=compact
+    )
+    return await stream_models(
+        schedules,
+        MenuScheduleListItem if compact else MenuScheduleResponse,
+        on_complete=lambda body: _schedule_list_cache.set(cache_key, tag_body(body), generation=generation),
     )
 
 @router.get(
@@ -113,10 +170,10 @@ async def get_all_schedules(
     description="Retrieve a specific menu schedule by its ID."
 )
 async def get_schedule(
-    schedule_id: str,
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_read()),
-) -> MenuScheduleResponse:
+    request: Request,
+    schedule_id: _ScheduleId,
+    current_user: dict = _require_read_dep,
+) -> Response:
     """
     Get a specific menu schedule by ID.
     
@@ -127,8 +184,21 @@ async def get_schedule(
     - Creation and update timestamps
     
     **schedule_id**: The unique identifier of the menu schedule
+    
+    The response carries an ETag; send it back in If-None-Match to get an
+    empty 304 Not Modified while the schedule is unchanged. The ETag is
+    checked against the schedule's last update time before it is loaded.
     """
-    return await service.get_schedule_by_id(schedule_id)
+    # Tag the version read before the schedule, so the tag never runs ahead of
+    # the body; a missing schedule is left to the full read to report
+    updated_at = await menu_schedule_service.get_schedule_version(schedule_id)
+    etag = version_tag(schedule_id, updated_at)
+    if updated_at is not None:
+        response = not_modified(etag, request)
+        if response is not None:
+            return response
+    schedule = await menu_schedule_service.get_schedule_by_id(schedule_id)
+    return etag_response((serialize_model(schedule, MenuScheduleResponse), etag), request)
 
 @router.get(
     "/{schedule_id}/detailed",
@@ -137,10 +207,10 @@ async def get_schedule(
     description="Get comprehensive schedule details with daily effective menus for administrators."
 )
 async def get_schedule_detailed(
-    schedule_id: str,
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_read()),
-) -> ScheduleDetailedResponse:
+    request: Request,
+    schedule_id: _ScheduleId,
+    current_user: dict = _require_read_dep,
+) -> Response:
     """
     Get detailed schedule view with daily effective menus for administrators.
     
@@ -163,8 +233,22 @@ async def get_schedule_detailed(
     - Location-specific menu information
     - Cycle day calculations
     - Summary totals for easy overview
+    
+    The response carries an ETag; send it back in If-None-Match to get an
+    empty 304 Not Modified while neither the schedule nor its menus changed.
+    The ETag is checked against the update times of the schedule, its menu
+    cycle and the cycle's dishes before the view is built.
     """
-    return await service.get_schedule_detailed_view(schedule_id)
+    # Tag the versions read before the view, so the tag never runs ahead of
+    # the body; a missing schedule is left to the full read to report
+    versions = await menu_schedule_service.get_schedule_detailed_version(schedule_id)
+    etag = version_tag(schedule_id, versions)
+    if versions is not None:
+        response = not_modified(etag, request)
+        if response is not None:
+            return response
+    detailed_view = await menu_schedule_service.get_schedule_detailed_view(schedule_id)
+    return etag_response((serialize_model(detailed_view, ScheduleDetailedResponse), etag), request)
 
 @router.patch(
     "/{schedule_id}",
@@ -173,11 +257,11 @@ async def get_schedule_detailed(
     description="Update an existing menu schedule's information."
 )
 async def update_schedule(
-    schedule_id: str,
+    schedule_id: _ScheduleId,
     schedule_data: MenuScheduleUpdate,
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_update()),
-) -> MenuScheduleResponse:
+    background_tasks: BackgroundTasks,
+    current_user: dict = _require_update_dep,
+) -> Response:
     """
     Update a menu schedule.
     
@@ -187,6 +271,10 @@ async def update_schedule(
     - Status
     - Cancellation information
     
+    Setting the status to cancelled records the cancellation (with the
+    current time when no cancellation information is sent), so dates or
+    coverage can be changed and the schedule cancelled in one request.
+    
     Business Rules:
     - Only ACTIVE or FUTURE schedules can be edited
     - Updates to coverage or end date trigger overlap validation
@@ -195,8 +283,15 @@ async def update_schedule(
     
     **schedule_id**: The unique identifier of the menu schedule to update
     **schedule_data**: The update data
+    
+    The schedule's nutritional report is rebuilt in the background.
     """
-    return await service.update_schedule(schedule_id, schedule_data)
+    result = await menu_schedule_service.update_schedule(schedule_id, schedule_data)
+    _schedule_list_cache.clear()
+    MenuScheduleService.clear_citizen_menu_cache()
+    NutritionalAnalysisService.forget_schedule_report(schedule_id)
+    background_tasks.add_task(NutritionalAnalysisService.warm_report_cache, schedule_id)
+    return model_response(result, MenuScheduleResponse)
 
 @router.patch(
     "/{schedule_id}/cancel",
@@ -205,11 +300,10 @@ async def update_schedule(
     description="Cancel a menu schedule with optional reason."
 )
 async def cancel_schedule(
-    schedule_id: str,
+    schedule_id: _ScheduleId,
     reason: Optional[str] = Query(None, description="Reason for cancellation"),
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_update()),
-) -> MenuScheduleResponse:
+    current_user: dict = _require_update_dep,
+) -> Response:
     """
     Cancel a menu schedule.
     
@@ -221,7 +315,11 @@ async def cancel_schedule(
     **schedule_id**: The unique identifier of the menu schedule to cancel
     **reason**: Optional reason for cancellation
     """
-    return await service.cancel_schedule(schedule_id, reason)
+    result = await menu_schedule_service.cancel_schedule(schedule_id, reason)
+    _schedule_list_cache.clear()
+    MenuScheduleService.clear_citizen_menu_cache()
+    NutritionalAnalysisService.forget_schedule_report(schedule_id)
+    return model_response(result, MenuScheduleResponse)
 
 @router.patch(
     "/{schedule_id}/uncancel",
@@ -230,11 +328,10 @@ async def cancel_schedule(
     description="Restore a cancelled menu schedule to its appropriate status."
 )
 async def uncancel_schedule(
-    schedule_id: str,
+    schedule_id: _ScheduleId,
     reason: Optional[str] = Query(None, description="Reason for uncancelling"),
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_update()),
-) -> MenuScheduleResponse:
+    current_user: dict = _require_update_dep,
+) -> Response:
     """
     Uncancel a menu schedule.
     
@@ -253,7 +350,11 @@ async def uncancel_schedule(
     **schedule_id**: The unique identifier of the menu schedule to uncancel
     **reason**: Optional reason for uncancelling (for audit purposes)
     """
-    return await service.uncancel_schedule(schedule_id, reason)
+    result = await menu_schedule_service.uncancel_schedule(schedule_id, reason)
+    _schedule_list_cache.clear()
+    MenuScheduleService.clear_citizen_menu_cache()
+    NutritionalAnalysisService.forget_schedule_report(schedule_id)
+    return model_response(result, MenuScheduleResponse)
 
 @router.get(
     "/citizen/menu",
@@ -262,12 +363,12 @@ async def uncancel_schedule(
     description="Get the effective menu for a specific location and date for citizen consultation."
 )
 async def get_citizen_menu(
+    request: Request,
     location_id: str = Query(..., description="Location ID (campus or town ID)"),
     location_type: LocationType = Query(..., description="Location type: 'campus' or 'town'"),
     date: date = Query(..., description="Date to get the menu for (YYYY-MM-DD format)"),
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_read()),
-) -> CitizenMenuResponse:
+    current_user: dict = _require_read_dep,
+) -> Response:
     """
     Get the effective menu for a specific location and date.
     
@@ -295,8 +396,29 @@ async def get_citizen_menu(
     If no menu is available for the specified location and date,
     the response will indicate this with is_available=false and
     provide a helpful message explaining why.
+    
+    Menus are cached briefly. If the lookup fails with a server error, the
+    last menu served for the same location and date is returned instead,
+    marked with an `X-Stale-Cache: true` header. Fresh menus carry an ETag;
+    send it back in If-None-Match to get an empty 304 Not Modified.
     """
-    return await service.get_effective_menu_for_citizen(location_id, location_type.value, date)
+    cache_key = (location_id, location_type, date)
+    tagged_body = _citizen_menu_cache.get(cache_key)
+    if tagged_body is not None:
+        return etag_response(tagged_body, request)
+    
+    try:
+        menu = await menu_schedule_service.get_effective_menu_for_citizen(location_id, location_type, date)
+    except HTTPException as e:
+        stale_tagged_body = _citizen_menu_fallback.get(cache_key)
+        if e.status_code < status.HTTP_500_INTERNAL_SERVER_ERROR or stale_tagged_body is None:
+            raise
+        return Response(content=stale_tagged_body[0], media_type="application/json", headers={"X-Stale-Cache": "true"})
+    
+    tagged_body = tag_body(serialize_model(menu, CitizenMenuResponse))
+    _citizen_menu_cache.set(cache_key, tagged_body)
+    _citizen_menu_fallback.set(cache_key, tagged_body)
+    return etag_response(tagged_body, request)
 
 @router.delete(
     "/{schedule_id}",
@@ -305,9 +427,8 @@ async def get_citizen_menu(
     description="Permanently delete a menu schedule from the system."
 )
 async def delete_schedule(
-    schedule_id: str,
-    service: MenuScheduleService = Depends(lambda: menu_schedule_service),
-    current_user: dict = Depends(require_delete()),
+    schedule_id: _ScheduleId,
+    current_user: dict = _require_delete_dep,
 ) -> dict:
     """
     Delete a menu schedule.
@@ -326,6 +447,10 @@ async def delete_schedule(
     Returns:
     - Confirmation message with details of the deleted schedule
     """
-    return await service.delete_schedule(schedule_id)
+    result = await menu_schedule_service.delete_schedule(schedule_id)
+    _schedule_list_cache.clear()
+    MenuScheduleService.clear_citizen_menu_cache()
+    NutritionalAnalysisService.forget_schedule_report(schedule_id)
+    return result
 
  
\ No newline at end of file
@@ -1,17 +1,23 @@
-from fastapi import APIRouter, HTTPException, Query, status, Depends
-from typing import Optional
+import asyncio
+from fastapi import APIRouter, HTTPException, Path, Query, Response, status, Depends
+from typing import Annotated, Optional
 
 from models.nutritional_analysis import (
     NutritionalAnalysisReport, SimplifiedNutritionalSummary, NutritionalComparisonReport
 )
+from models.commons import OBJECT_ID_PATTERN
 from services.nutritional_analysis_service import NutritionalAnalysisService
 from core.dependencies import require_list, require_read, require_update, require_delete, require_create
+from core.responses import model_response
 
 router = APIRouter(
     tags=["Nutritional Analysis"],
     responses={404: {"description": "Not found"}},
 )
 
+# Malformed IDs are rejected with a 422 before any database work
+_ScheduleId = Annotated[str, Path(pattern=OBJECT_ID_PATTERN, description="Menu schedule ID")]
+
 
 @router.get(
     "/report/{schedule_id}",
@@ -20,9 +26,9 @@ router = APIRouter(
     description="Generate a complete nutritional analysis report for a menu schedule, including food groups, nutrients, and recommendations."
 )
 async def generate_nutritional_report(
-    schedule_id: str,
+    schedule_id: _ScheduleId,
     current_user: dict = Depends(require_create()),
-) -> NutritionalAnalysisReport:
+) -> Response:
     """
     Generate a comprehensive nutritional analysis report for a menu schedule.
     
@@ -37,7 +43,10 @@ async def generate_nutritional_report(
     
     - **schedule_id**: The unique identifier of the menu schedule to analyze
     """
-    return await NutritionalAnalysisService.generate_nutritional_report(schedule_id)
+    return model_response(
+        await NutritionalAnalysisService.generate_nutritional_report(schedule_id),
+        NutritionalAnalysisReport,
+    )
 
 
 @router.get(
@@ -47,9 +56,9 @@ async def generate_nutritional_report(
     description="Get a simplified overview of nutritional content for quick assessment."
 )
 async def get_nutritional_summary(
-    schedule_id: str,
+    schedule_id: _ScheduleId,
     current_user: dict = Depends(require_read()),
-) -> SimplifiedNutritionalSummary:
+) -> Response:
     """
     Get a simplified nutritional summary for quick overview.
     
@@ -63,7 +72,10 @@ async def get_nutritional_summary(
     
     - **schedule_id**: The unique identifier of the menu schedule to analyze
     """
-    return await NutritionalAnalysisService.get_simplified_summary(schedule_id)
+    return model_response(
+        await NutritionalAnalysisService.get_simplified_summary(schedule_id),
+        SimplifiedNutritionalSummary,
+    )
 
 
 @router.get(
@@ -73,13 +85,13 @@ async def get_nutritional_summary(
     description="Compare the nutritional content of a menu schedule against standard nutritional requirements."
 )
 async def compare_with_requirements(
-    schedule_id: str,
+    schedule_id: _ScheduleId,
     age_group: Optional[str] = Query(
         "school_age_6_12", 
         description="Age group for nutritional requirements (school_age_6_12 or school_age_13_18)"
     ),
     current_user: dict = Depends(require_read()),
-) -> NutritionalComparisonReport:
+) -> Response:
     """
     Compare menu nutrition with standard nutritional requirements.
     
@@ -97,7 +109,10 @@ async def compare_with_requirements(
     - **schedule_id**: The unique identifier of the menu schedule to analyze
     - **age_group**: Target age group (school_age_6_12 or school_age_13_18)
     """
-    return await NutritionalAnalysisService.compare_with_requirements(schedule_id, age_group)
+    return model_response(
+        await NutritionalAnalysisService.compare_with_requirements(schedule_id, age_group),
+        NutritionalComparisonReport,
+    )
 
 
 @router.get(
@@ -107,7 +122,7 @@ async def compare_with_requirements(
     description="Get detailed food group analysis for a menu schedule."
 )
 async def get_food_group_analysis(
-    schedule_id: str,
+    schedule_id: _ScheduleId,
     current_user: dict = Depends(require_read()),
 ) -> dict:
     """
@@ -123,30 +138,7 @@ async def get_food_group_analysis(
     - **schedule_id**: The unique identifier of the menu schedule to analyze
     """
     try:
-        full_report = await NutritionalAnalysisService.generate_nutritional_report(schedule_id)
-        
-        # Extract food group information
-        food_group_analysis = {
-            "menu_schedule_id": schedule_id,
-            "menu_cycle_name": full_report.menu_cycle_name,
-            "analysis_period": full_report.analysis_period,
-            "average_daily_food_groups": [
-                {
-                    "food_group": fg.food_group.value,
-                    "total_portions": fg.total_portions,
-                    "dishes_count": fg.dishes_count,
-                    "main_dishes": fg.main_dishes
-                }
-                for fg in full_report.average_daily_food_groups
-            ],
-            "food_group_diversity": len(full_report.average_daily_food_groups),
-            "recommendations": [
-                rec for rec in full_report.recommendations 
-                if any(keyword in rec.lower() for keyword in ["group", "fruit", "vegetable", "dairy", "protein", "grain"])
-            ]
-        }
-        
-        return food_group_analysis
+        return await NutritionalAnalysisService.get_food_group_analysis(schedule_id)
         
     except HTTPException:
         raise
@@ -164,7 +156,7 @@ async def get_food_group_analysis(
     description="Get detailed nutrient analysis for a menu schedule."
 )
 async def get_nutrient_analysis(
-    schedule_id: str,
+    schedule_id: _ScheduleId,
     current_user: dict = Depends(require_read()),
 ) -> dict:
     """
@@ -180,39 +172,7 @@ async def get_nutrient_analysis(
     - **schedule_id**: The unique identifier of the menu schedule to analyze
     """
     try:
-        full_report = await NutritionalAnalysisService.generate_nutritional_report(schedule_id)
-        
-        # Extract nutrient information
-        nutrients = full_report.average_daily_nutrients
-        
-        nutrient_analysis = {
-            "menu_schedule_id": schedule_id,
-            "menu_cycle_name": full_report.menu_cycle_name,
-            "analysis_period": full_report.analysis_period,
-            "average_daily_nutrients": {
-                "calories": nutrients.total_calories,
-                "protein": nutrients.total_protein,
-                "carbohydrates": nutrients.total_carbohydrates,
-                "fat": nutrients.total_fat,
-                "fiber": nutrients.total_fiber,
-                "calcium": nutrients.total_calcium,
-                "iron": nutrients.total_iron,
-                "vitamin_c": nutrients.total_vitamin_c,
-                "vitamin_a": nutrients.total_vitamin_a
-            },
-            "macronutrient_distribution": {
-                "protein_percentage": (nutrients.total_protein * 4 / nutrients.total_calories * 100) if nutrients.total_calories > 0 else 0,
-                "carbohydrate_percentage": (nutrients.total_carbohydrates * 4 / nutrients.total_calories * 100) if nutrients.total_calories > 0 else 0,
-                "fat_percentage": (nutrients.total_fat * 9 / nutrients.total_calories * 100) if nutrients.total_calories > 0 else 0
-            },
-            "nutritional_adequacy_score": full_report.nutritional_adequacy_score,
-            "recommendations": [
-                rec for rec in full_report.recommendations 
-                if any(keyword in rec.lower() for keyword in ["calorie", "protein", "vitamin", "mineral", "iron", "calcium"])
-            ]
-        }
-        
-        return nutrient_analysis
+        return await NutritionalAnalysisService.get_nutrient_analysis(schedule_id)
         
     except HTTPException:
         raise
@@ -220,4 +180,39 @@ async def get_nutrient_analysis(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error generating nutrient analysis: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+
+@router.get(
+    "/combined/{schedule_id}",
+    response_model=dict,
+    summary="Get food group and nutrient analysis",
+    description="Get the food group and nutrient analyses of a menu schedule in a single request."
+)
+async def get_combined_analysis(
+    schedule_id: _ScheduleId,
+    current_user: dict = Depends(require_read()),
+) -> dict:
+    """
+    Get the food group and nutrient analyses of a menu schedule together.
+    
+    Returns the same content as the `/food-groups` and `/nutrients` endpoints
+    under the `food_groups` and `nutrients` keys, saving dashboards a second
+    round trip. Both analyses are derived concurrently from one report.
+    
+    - **schedule_id**: The unique identifier of the menu schedule to analyze
+    """
+    try:
+        food_groups, nutrients = await asyncio.gather(
+            NutritionalAnalysisService.get_food_group_analysis(schedule_id),
+            NutritionalAnalysisService.get_nutrient_analysis(schedule_id),
+        )
+        return {"food_groups": food_groups, "nutrients": nutrients}
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating combined analysis: {str(e)}"
+        )
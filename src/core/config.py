@@ -1,5 +1,8 @@
+from functools import cached_property
+from typing import List, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, field_validator
+from pydantic import Field, computed_field
 
 
 class Settings(BaseSettings):
@@ -12,65 +15,80 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = Field(default="example", description="MongoDB password")
     DB_NAME: str = Field(default="pae_menus", description="MongoDB database name")
     DB_AUTH_NAME: str = Field(default="admin", description="MongoDB authentication database")
+    DB_SKIP_INDEXES: bool = Field(default=False, description="Skip index creation on startup (indexes managed out of band)")
+    DB_MAX_POOL_SIZE: int = Field(default=50, description="Maximum MongoDB connections kept by this process")
+    DB_MIN_POOL_SIZE: int = Field(default=20, description="MongoDB connections kept open while idle")
+    DB_COMPRESSORS: str = Field(default="zlib", description="Wire compressors offered to MongoDB in order of preference, e.g. 'zstd,zlib' when zstandard is installed")
 
-    MONGO_URL: str | None = None
-    MONGO_URL_WITHOUT_DB: str | None = None
-    
-    @field_validator("MONGO_URL", mode='before')
-    @classmethod
-    def assemble_mongo_url(cls, v: str | None, values) -> any:
-        if isinstance(v, str):
-            return v
-        
-        data = values.data
-        return f"mongodb://{data.get('DB_USER')}:{data.get('DB_PASSWORD')}@{data.get('DB_HOST')}:{data.get('DB_PORT')}/{data.get('DB_NAME')}?authSource={data.get('DB_AUTH_NAME')}"
-    
-    @field_validator("MONGO_URL_WITHOUT_DB", mode='before')
-    @classmethod
-    def assemble_mongo_url_without_db(cls, v: str | None, values) -> any:
-        if isinstance(v, str):
-            return v
-        
-        data = values.data
-        return f"mongodb://{data.get('DB_USER')}:{data.get('DB_PASSWORD')}@{data.get('DB_HOST')}:{data.get('DB_PORT')}/?authSource={data.get('DB_AUTH_NAME')}"
+    # Full URLs set directly, e.g. mongodb+srv:// or with query options, take
+    # precedence over the ones built from the fields above
+    MONGO_URL_OVERRIDE: Optional[str] = Field(default=None, alias="MONGO_URL", description="Complete MongoDB URL, including the database")
+    MONGO_URL_WITHOUT_DB_OVERRIDE: Optional[str] = Field(default=None, alias="MONGO_URL_WITHOUT_DB", description="Complete MongoDB URL without a database, used by the client")
+
+    @computed_field
+    @cached_property
+    def MONGO_URL(self) -> str:
+        if self.MONGO_URL_OVERRIDE:
+            return self.MONGO_URL_OVERRIDE
+        return f"mongodb://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}?authSource={self.DB_AUTH_NAME}"
+
+    @computed_field
+    @cached_property
+    def MONGO_URL_WITHOUT_DB(self) -> str:
+        if self.MONGO_URL_WITHOUT_DB_OVERRIDE:
+            return self.MONGO_URL_WITHOUT_DB_OVERRIDE
+        return f"mongodb://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/?authSource={self.DB_AUTH_NAME}"
     
     # Environment-specific settings
     ENV_STATE: str
     APP_NAME: str
     API_PREFIX_STR: str
     MODULE_IDENTIFIER: str
+    CORS_ALLOW_ORIGINS: List[str] = Field(default=["*"], description="Origins allowed to call the API (JSON list)")
 
     # External Services Configuration
     NUTRIPAE_AUTH_HOST: str
     NUTRIPAE_AUTH_PORT: int
     NUTRIPAE_AUTH_PREFIX_STR: str = "/api/v1"
-    NUTRIPAE_AUTH_URL: str | None = None
+    NUTRIPAE_AUTH_URL_OVERRIDE: Optional[str] = Field(default=None, alias="NUTRIPAE_AUTH_URL", description="Complete auth service URL, instead of host, port and prefix")
 
-    @field_validator("NUTRIPAE_AUTH_URL", mode='before')
-    @classmethod
-    def assemble_nutripae_auth_url(cls, v: str | None, values) -> any:
-        if isinstance(v, str):
-            return v
-        
-        data = values.data
-        return f"http://{data.get('NUTRIPAE_AUTH_HOST')}:{data.get('NUTRIPAE_AUTH_PORT')}{data.get('NUTRIPAE_AUTH_PREFIX_STR')}"
+    @computed_field
+    @cached_property
+    def NUTRIPAE_AUTH_URL(self) -> str:
+        if self.NUTRIPAE_AUTH_URL_OVERRIDE:
+            return self.NUTRIPAE_AUTH_URL_OVERRIDE
+        return f"http://{self.NUTRIPAE_AUTH_HOST}:{self.NUTRIPAE_AUTH_PORT}{self.NUTRIPAE_AUTH_PREFIX_STR}"
     
     NUTRIPAE_COVERAGE_HOST: str
     NUTRIPAE_COVERAGE_PORT: int
     NUTRIPAE_COVERAGE_PREFIX_STR: str = "/api/v1"
-    NUTRIPAE_COVERAGE_URL: str | None = None
+    NUTRIPAE_COVERAGE_URL_OVERRIDE: Optional[str] = Field(default=None, alias="NUTRIPAE_COVERAGE_URL", description="Complete coverage service URL, instead of host, port and prefix")
 
-    @field_validator("NUTRIPAE_COVERAGE_URL", mode='before')
-    @classmethod
-    def assemble_nutripae_coverage_url(cls, v: str | None, values) -> any:
-        if isinstance(v, str):
-            return v
-        
-        data = values.data
-        return f"http://{data.get('NUTRIPAE_COVERAGE_HOST')}:{data.get('NUTRIPAE_COVERAGE_PORT')}{data.get('NUTRIPAE_COVERAGE_PREFIX_STR')}"
+    @computed_field
+    @cached_property
+    def NUTRIPAE_COVERAGE_URL(self) -> str:
+        if self.NUTRIPAE_COVERAGE_URL_OVERRIDE:
+            return self.NUTRIPAE_COVERAGE_URL_OVERRIDE
+        return f"http://{self.NUTRIPAE_COVERAGE_HOST}:{self.NUTRIPAE_COVERAGE_PORT}{self.NUTRIPAE_COVERAGE_PREFIX_STR}"
     
     OTLP_GRPC_ENDPOINT: str
 
+    # Caching. Every cache below lives in the process and is cleared only by
+    # writes handled by that same process, so the API must run as a single
+    # worker; startup fails if WEB_CONCURRENCY asks for more.
+    WEB_CONCURRENCY: int = Field(default=1, description="Worker processes requested from uvicorn or gunicorn; must be 1 because caches are per process")
+    LIST_CACHE_TTL_SECONDS: int = Field(default=300, description="Lifetime of cached list responses in seconds")
+    SCHEDULE_LIST_CACHE_TTL_SECONDS: int = Field(default=30, description="Lifetime of cached menu schedule lists in seconds")
+    REPORT_CACHE_TTL_SECONDS: int = Field(default=300, description="Lifetime of cached nutritional reports in seconds")
+    FINISHED_REPORT_CACHE_TTL_SECONDS: int = Field(default=6 * 3600, description="Lifetime of cached nutritional reports of completed or cancelled schedules in seconds")
+    RECENT_REPORT_TTL_SECONDS: int = Field(default=30, description="How long a schedule's last report is served without re-reading the schedule and menu cycle, in seconds")
+    ITEM_CACHE_TTL_SECONDS: int = Field(default=60, description="Lifetime of cached single-item reads in seconds")
+    NAME_CHECK_CACHE_TTL_SECONDS: int = Field(default=5, description="Lifetime of cached name uniqueness checks in seconds")
+    CITIZEN_MENU_CACHE_TTL_SECONDS: int = Field(default=60, description="Lifetime of cached citizen menus in seconds")
+    CITIZEN_MENU_STALE_TTL_SECONDS: int = Field(default=24 * 3600, description="How long the last good citizen menu is kept to answer while the database fails, in seconds")
+
+    # Nutritional analysis
+    MAX_CONCURRENT_REPORT_BUILDS: int = Field(default=8, description="Nutritional reports computed at the same time; further builds wait their turn")
     
     model_config = SettingsConfigDict(
         env_file=".env",
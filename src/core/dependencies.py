@@ -1,7 +1,8 @@
 import httpx
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status, Security, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import List
+from typing import List, Optional
 import logging
 
 from core.config import settings
@@ -11,6 +12,27 @@ logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
 
+# Cliente HTTP compartido para el servicio de auth: reutiliza su pool de
+# conexiones entre requests en lugar de abrir uno nuevo por cada verificación
+_auth_client: Optional[httpx.AsyncClient] = None
+
+
+def get_auth_client() -> httpx.AsyncClient:
+    """Devuelve el cliente compartido del servicio de auth, creándolo en el primer uso."""
+    global _auth_client
+    if _auth_client is None or _auth_client.is_closed:
+        _auth_client = httpx.AsyncClient(timeout=10.0)
+    return _auth_client
+
+
+async def close_auth_client() -> None:
+    """Cierra el cliente compartido del servicio de auth; se llama al apagar la app."""
+    global _auth_client
+    if _auth_client is not None:
+        await _auth_client.aclose()
+        _auth_client = None
+
+@lru_cache(maxsize=None)
 def require_permission(permission: str):
     """
     Crea una dependencia que verifica si el usuario tiene un permiso específico.
@@ -22,7 +44,8 @@ def require_permission(permission: str):
         permission: El permiso requerido (ej: "nutripae-rh:create")
     
     Returns:
-        Una función async que valida el permiso
+        Una función async que valida el permiso. Se memoiza por permiso para
+        que todos los endpoints compartan la misma función.
     """
     async def permission_checker(
         request: Request,
@@ -50,71 +73,71 @@ def require_permission(permission: str):
             logger.info(f"NUTRIPAE_AUTH_URL: {settings.NUTRIPAE_AUTH_URL}")
             
             # Hacer request al servicio de auth
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{settings.NUTRIPAE_AUTH_URL}/authorization/check-authorization",
-                    headers={"Authorization": f"Bearer {token}"},
-                    json=auth_payload
-                )
-                
-                # Manejar diferentes códigos de respuesta del servicio auth
-                if response.status_code == 401:
-                    # Token inválido, expirado, o usuario no encontrado
-                    error_detail = "Invalid or expired token"
-                    try:
-                        error_info = response.json()
-                        error_detail = error_info.get("detail", error_detail)
-                    except:
-                        pass
-                    
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail=error_detail,
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
-                
-                elif response.status_code == 403:
-                    # Usuario válido pero sin permisos suficientes
-                    raise HTTPException(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        detail="Access forbidden - insufficient permissions",
-                    )
-                
-                elif response.status_code == 500:
-                    # Error interno del servicio auth
-                    logger.error(f"Auth service internal error: {response.text}")
-                    raise HTTPException(
-                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                        detail="Authentication service error",
-                    )
-                
-                elif response.status_code != 200:
-                    # Cualquier otro error
-                    logger.error(f"Unexpected auth service response: {response.status_code} - {response.text}")
-                    raise HTTPException(
-                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                        detail="Authentication service unavailable",
-                    )
-                
-                # Procesar respuesta exitosa
-                auth_result = response.json()
-                
-                if not auth_result.get("authorized", False):
-                    missing_perms = auth_result.get("missing_permissions", [])
-                    logger.warning(f"User lacks permissions. Missing: {missing_perms}")
-                    raise HTTPException(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        detail=f"You do not have enough permissions. Missing: {', '.join(missing_perms)}",
-                    )
-                
-                logger.info(f"Authorization successful for user {auth_result.get('user_email')}")
-                
-                # Retornamos solo la información mínima necesaria
-                return {
-                    "user_id": auth_result.get("user_id"),
-                    "user_email": auth_result.get("user_email")
-                }
+            client = get_auth_client()
+            response = await client.post(
+                f"{settings.NUTRIPAE_AUTH_URL}/authorization/check-authorization",
+                headers={"Authorization": f"Bearer {token}"},
+                json=auth_payload
+            )
+            
+            # Manejar diferentes códigos de respuesta del servicio auth
+            if response.status_code == 401:
+                # Token inválido, expirado, o usuario no encontrado
+                error_detail = "Invalid or expired token"
+                try:
+                    error_info = response.json()
+                    error_detail = error_info.get("detail", error_detail)
+                except:
+                    pass
                 
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail=error_detail,
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            
+            elif response.status_code == 403:
+                # Usuario válido pero sin permisos suficientes
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Access forbidden - insufficient permissions",
+                )
+            
+            elif response.status_code == 500:
+                # Error interno del servicio auth
+                logger.error(f"Auth service internal error: {response.text}")
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication service error",
+                )
+            
+            elif response.status_code != 200:
+                # Cualquier otro error
+                logger.error(f"Unexpected auth service response: {response.status_code} - {response.text}")
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication service unavailable",
+                )
+            
+            # Procesar respuesta exitosa
+            auth_result = response.json()
+            
+            if not auth_result.get("authorized", False):
+                missing_perms = auth_result.get("missing_permissions", [])
+                logger.warning(f"User lacks permissions. Missing: {missing_perms}")
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail=f"You do not have enough permissions. Missing: {', '.join(missing_perms)}",
+                )
+            
+            logger.info(f"Authorization successful for user {auth_result.get('user_email')}")
+            
+            # Retornamos solo la información mínima necesaria
+            return {
+                "user_id": auth_result.get("user_id"),
+                "user_email": auth_result.get("user_email")
+            }
+            
         except httpx.TimeoutException:
             logger.error("Timeout connecting to authentication service")
             raise HTTPException(
@@ -140,18 +163,24 @@ def require_permission(permission: str):
     return permission_checker
 
 # Dependencias específicas para cada tipo de operación
-# Cada endpoint especifica exactamente qué permiso necesita
+# Cada endpoint especifica exactamente qué permiso necesita; se memoizan para
+# que todos los routers reciban el mismo callable
+@lru_cache(maxsize=None)
 def require_create():
     return require_permission("nutripae-menus:create")
 
+@lru_cache(maxsize=None)
 def require_read():
     return require_permission("nutripae-menus:read")
 
+@lru_cache(maxsize=None)
 def require_list():
     return require_permission("nutripae-menus:list")
 
+@lru_cache(maxsize=None)
 def require_update():
     return require_permission("nutripae-menus:update")
 
+@lru_cache(maxsize=None)
 def require_delete():
     return require_permission("nutripae-menus:delete") 
\ No newline at end of file
@@ -0,0 +1,174 @@
+"""
+Response helpers for returning trusted service output.
+
+FastAPI validates a handler's return value against ``response_model`` before
+serializing it. Read endpoints build their response models from documents
+that were validated on the way into MongoDB, so they can hand them to these
+helpers and skip that second pass. ``response_model`` stays on the route for
+the OpenAPI schema.
+"""
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Any, AsyncIterable, AsyncIterator, Callable, List, Optional, Tuple
+
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+# Streamed bodies are flushed to the client in chunks of roughly this size
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def get_type_adapter(response_type: Any) -> TypeAdapter:
+    """Return a cached TypeAdapter for ``response_type``."""
+    return TypeAdapter(response_type)
+
+
+def serialize_model(content: Any, response_type: Any, exclude_none: bool = False) -> bytes:
+    """Render ``content`` as JSON bytes using ``response_type``'s serializer."""
+    return get_type_adapter(response_type).dump_json(
+        content, by_alias=True, exclude_none=exclude_none
+    )
+
+
+def model_response(
+    content: Any,
+    response_type: Any,
+    status_code: int = status.HTTP_200_OK,
+    exclude_none: bool = False,
+) -> Response:
+    """
+    Serialize ``content`` as ``response_type`` without validating it again.
+
+    Args:
+        content: A model instance (or list of them) matching ``response_type``
+        response_type: The declared response type, e.g. ``List[DishResponse]``
+        status_code: HTTP status code of the response
+        exclude_none: Leave out fields whose value is None, for large lists
+            of models with mostly empty optional fields
+
+    Returns:
+        Response: JSON response rendered with field aliases, like FastAPI does
+    """
+    body = serialize_model(content, response_type, exclude_none=exclude_none)
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def tag_body(body: bytes) -> Tuple[bytes, str]:
+    """Pair a serialized body with its strong ETag, for caching both together."""
+    return body, f'"{blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def version_tag(*versions: Any) -> str:
+    """
+    Build a strong ETag from the versions a response is built from.
+
+    Lets a handler answer If-None-Match from a few projected fields, e.g.
+    IDs and ``updated_at`` timestamps, before building the response.
+    """
+    return f'"{blake2b(repr(versions).encode(), digest_size=8).hexdigest()}"'
+
+
+def not_modified(etag: str, request: Request) -> Optional[Response]:
+    """
+    Return an empty 304 if the request's ``If-None-Match`` matches ``etag``.
+
+    Weak client tags (``W/"..."``) and ``*`` match as well.
+
+    Returns:
+        Optional[Response]: The 304 response carrying the ``ETag`` header, or
+            None if the client needs the full body
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_tags or "*" in client_tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def etag_response(tagged_body: Tuple[bytes, str], request: Request) -> Response:
+    """
+    Return a JSON body, or an empty 304 if the client already has it.
+
+    Args:
+        tagged_body: The ``(body, etag)`` pair built by ``tag_body``, or a
+            body with a ``version_tag``
+        request: The incoming request, checked for ``If-None-Match``
+
+    Returns:
+        Response: 304 Not Modified when the client's copy matches, otherwise
+            the JSON body; both carry the ``ETag`` header
+    """
+    body, etag = tagged_body
+    response = not_modified(etag, request)
+    if response is not None:
+        return response
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+async def _json_array_chunks(
+    items: AsyncIterable[Any],
+    item_type: Any,
+    on_complete: Optional[Callable[[bytes], None]],
+    exclude_none: bool,
+) -> AsyncIterator[bytes]:
+    adapter = get_type_adapter(item_type)
+    sent: List[bytes] = []
+    buffer = bytearray(b"[")
+    separator = b""
+    async for item in items:
+        buffer += separator
+        buffer += adapter.dump_json(item, by_alias=True, exclude_none=exclude_none)
+        separator = b","
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            chunk = bytes(buffer)
+            buffer.clear()
+            if on_complete is not None:
+                sent.append(chunk)
+            yield chunk
+    buffer += b"]"
+    chunk = bytes(buffer)
+    yield chunk
+    if on_complete is not None:
+        sent.append(chunk)
+        on_complete(b"".join(sent))
+
+
+async def _prepend(first_chunk: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first_chunk
+    async for chunk in chunks:
+        yield chunk
+
+
+async def stream_models(
+    items: AsyncIterable[Any],
+    item_type: Any,
+    on_complete: Optional[Callable[[bytes], None]] = None,
+    exclude_none: bool = False,
+) -> StreamingResponse:
+    """
+    Stream ``items`` to the client as a JSON array while they are being read.
+
+    The first chunk (up to ``STREAM_CHUNK_SIZE`` bytes) is read before the
+    response starts, so a list that fits in it, or a cursor that fails before
+    filling it, is reported with the usual error status. Once the status line
+    has been sent a later failure can only abort the connection, leaving the
+    client with an incomplete body.
+
+    Args:
+        items: Async iterable of models matching ``item_type``, usually backed
+            by a database cursor
+        item_type: The declared type of a single item, e.g. ``DishResponse``
+        on_complete: Optional callback receiving the complete body once the
+            last chunk has been sent, e.g. to cache it; pass the cache's
+            ``generation`` along so a write during the stream is not undone
+        exclude_none: Leave out fields whose value is None
+
+    Returns:
+        StreamingResponse: JSON array response rendered with field aliases
+    """
+    chunks = _json_array_chunks(items, item_type, on_complete, exclude_none)
+    first_chunk = await anext(chunks)
+    return StreamingResponse(_prepend(first_chunk, chunks), media_type="application/json")
@@ -21,7 +21,10 @@ async def init_db() -> None:
     This function:
     1. Creates a connection to MongoDB using Motor
     2. Initializes Beanie with all document models
-    3. Sets up database indexes
+    3. Sets up database indexes (unless DB_SKIP_INDEXES is set)
+    
+    Motor connects lazily, so the first Beanie operation establishes the
+    connection and reports an unreachable server within serverSelectionTimeoutMS.
     
     Raises:
         Exception: If database connection or initialization fails
@@ -36,15 +39,17 @@ async def init_db() -> None:
             settings.MONGO_URL_WITHOUT_DB,
             serverSelectionTimeoutMS=5000,  # 5 second timeout
             connectTimeoutMS=5000,
-            maxPoolSize=50,
-            minPoolSize=10,
+            maxPoolSize=settings.DB_MAX_POOL_SIZE,
+            minPoolSize=settings.DB_MIN_POOL_SIZE,
             maxIdleTimeMS=30000,
+            retryWrites=True,
+            # Menu, dish and schedule documents compress well on the wire
+            compressors=settings.DB_COMPRESSORS,
+            zlibCompressionLevel=3,
+            # Lets the server attribute connections and slow queries to this service
+            appname=settings.APP_NAME,
         )
         
-        # Test the connection
-        await motor_client.admin.command('ping')
-        logger.info("Successfully connected to MongoDB")
-        
         # Get the database
         database = motor_client[settings.DB_NAME]
         
@@ -58,7 +63,8 @@ async def init_db() -> None:
         
         await init_beanie(
             database=database,
-            document_models=document_models
+            document_models=document_models,
+            skip_indexes=settings.DB_SKIP_INDEXES
         )
         
         logger.info(f"Successfully initialized Beanie ODM with database '{settings.DB_NAME}'")
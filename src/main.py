@@ -1,14 +1,18 @@
 # pae_menus/main.py
 import logging
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
-from motor.motor_asyncio import AsyncIOMotorClient
-from beanie import init_beanie
 from utils.telemetrics import PrometheusMiddleware, metrics, setting_otlp
+from utils.cache import require_single_worker
 from core.config import settings
+from core.dependencies import close_auth_client
 from api import api_router
-from models import Ingredient, Dish, MenuCycle, MenuSchedule
+from models import Ingredient, Dish
+from database import init_db, close_db_connection, get_database
 from fastapi.openapi.utils import get_openapi
 import uvicorn
 
@@ -27,25 +31,28 @@ async def lifespan(app: FastAPI):
     Handle startup and shutdown events.
     """
     logger.info("Starting up...")
-    app.mongodb_client = AsyncIOMotorClient(settings.MONGO_URL)
-    app.mongodb = app.mongodb_client[settings.DB_NAME]
-
-    await init_beanie(
-        database=app.mongodb,
-        document_models=[
-            Ingredient,
-            Dish,
-            MenuCycle,
-            MenuSchedule,
-        ]
-    )
+    # Caches are cleared per process, so several workers would serve stale data
+    require_single_worker(settings.WEB_CONCURRENCY)
+    # database.py owns the only Motor client and its connection pool
+    await init_db()
+    app.mongodb = await get_database()
     logger.info("Database and Beanie initialized.")
+
+    backfilled = await Dish.backfill_name_lc()
+    if backfilled:
+        logger.info(f"Backfilled search names for {backfilled} {Dish.Settings.name}.")
+    # Ingredient names need a one-off migration (scripts.backfill_name_lc);
+    # refuse to start until it has run rather than serve non-unique names
+    await Ingredient.ensure_name_lc_index()
+
+    # Build the OpenAPI schema now so the first docs request doesn't pay for it
+    app.openapi()
     
     yield
     
     logger.info("Shutting down...")
-    app.mongodb_client.close()
-    logger.info("MongoDB connection closed.")
+    await close_auth_client()
+    await close_db_connection()
 
 
 def custom_openapi():
@@ -75,6 +82,7 @@ app = FastAPI(
     title="PAE Menus API",
     description="API for managing menus in the PAE system.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -85,33 +93,48 @@ setting_otlp(app, settings.APP_NAME, settings.OTLP_GRPC_ENDPOINT)
 
 class EndpointFilter(logging.Filter):
     # Uvicorn endpoint access log filter
+    # uvicorn.access records carry (client, method, path, http_version, status)
+    # as args, so the path is checked without formatting the message
+    QUIET_PATHS = frozenset({"/metrics", "/health", "/health/database"})
+
     def filter(self, record: logging.LogRecord) -> bool:
-        return record.getMessage().find("GET /metrics") == -1
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3 and isinstance(args[2], str):
+            return args[2].partition("?")[0] not in self.QUIET_PATHS
+        return True
 
 
-# Filter out /endpoint
+# Filter out scrape and probe endpoints
 logging.getLogger("uvicorn.access").addFilter(EndpointFilter())
 # Set custom OpenAPI schema
 app.openapi = custom_openapi
 
+# Compress large JSON bodies such as reports, schedule lists and detailed views
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Configurar CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Permite todas las origenes
+    allow_origins=settings.CORS_ALLOW_ORIGINS,  # Origenes permitidos (por defecto todos)
     allow_credentials=True,
-    allow_methods=["*"],  # Permite todos los métodos
-    allow_headers=["*"],  # Permite todos los headers
+    allow_methods=["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"],  # Métodos usados por la API
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],  # Headers usados por la API
+    expose_headers=["ETag", "X-Stale-Cache"],  # Headers de respuesta legibles desde el navegador
 )
 
 app.include_router(api_router, prefix=settings.API_PREFIX_STR, tags=["Menus"])
 
+# Static payloads serialized once at import; /health is hit by every probe
+_ROOT_BODY = orjson.dumps({"message": "Welcome to the PAE Menus API"})
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "PAE Menus API"})
+
 @app.get("/")
-def read_root():
-    return {"message": "Welcome to the PAE Menus API"}
+async def read_root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
-def health_check():
-    return {"status": "healthy", "service": "PAE Menus API"}
+async def health_check():
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.get("/health/database")
 async def database_health_check():
@@ -179,4 +202,13 @@ if __name__ == "__main__":
     logger = logging.getLogger(__name__)
     logger.info("Iniciando NutriPAE-AUTH con configuración de logging mejorada...")
     
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_config=log_config)
\ No newline at end of file
+    # uvloop and httptools come with uvicorn[standard] (via fastapi[all]);
+    # naming them makes a missing install fail loudly instead of falling back
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        log_config=log_config,
+        loop="uvloop",
+        http="httptools",
+    )
\ No newline at end of file
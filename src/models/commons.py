@@ -1,9 +1,43 @@
 from enum import Enum
 from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from typing import List, Literal, Optional
 from beanie import PydanticObjectId
+from datetime import datetime, timezone
 import re
 
+# Leading number in values like "25g", "100mg" or "15.5g"
+_NUMERIC_VALUE_RE = re.compile(r'(\d+\.?\d*)')
+
+_UTC = timezone.utc
+
+# Shape of a MongoDB ObjectId in hex, for validating IDs taken as plain strings
+OBJECT_ID_PATTERN = r"^[0-9a-fA-F]{24}$"
+
+
+def name_search_filter(term: str) -> dict:
+    """
+    MongoDB filter for a case-insensitive search on a document's name.
+
+    Names starting with `term` are a range scan on the `name_lc` index; names
+    containing it as whole words, e.g. "pollo" in "Arroz con pollo", come
+    from the text index on `name`. Both branches are indexed, as `$text`
+    inside `$or` requires.
+    """
+    prefix = term.casefold()
+    phrase = term.replace('"', " ")
+    return {
+        "$or": [
+            {"name_lc": {"$gte": prefix, "$lt": prefix + "\uffff"}},
+            {"$text": {"$search": f'"{phrase}"'}},
+        ]
+    }
+
+
+def utc_now() -> datetime:
+    """Current time as a timezone-aware UTC datetime, used for document timestamps"""
+    return datetime.now(_UTC)
+
+
 class MealType(str, Enum):
     """
     Meal types for dish categorization.
@@ -17,6 +51,9 @@ class MealType(str, Enum):
     LUNCH = "almuerzo"
     SNACK = "refrigerio"
 
+# MealType values as a plain string type, for query-string filters
+MealTypeValue = Literal["desayuno", "almuerzo", "refrigerio"]
+
 class Portion(BaseModel):
     ingredient_id: PydanticObjectId
     quantity: float = Field(..., gt=0, description="Net quantity of the ingredient")
@@ -53,8 +90,10 @@ class NutritionalInfo(BaseModel):
         if isinstance(v, (int, float)):
             return float(v)
         if isinstance(v, str):
+            if v.isdecimal():
+                return float(v)
             # Extract numeric value from string like "25g", "100mg", "15.5g"
-            match = re.search(r'(\d+\.?\d*)', v.strip())
+            match = _NUMERIC_VALUE_RE.search(v)
             if match:
                 return float(match.group(1))
             return None
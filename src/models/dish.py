@@ -1,9 +1,10 @@
-from beanie import Document, Indexed, PydanticObjectId
+from beanie import Document, Indexed, Insert, PydanticObjectId, Replace, Save, SaveChanges, before_event
+from pymongo import TEXT, IndexModel, UpdateOne
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from typing import Literal, Optional, List
 from enum import Enum
 from datetime import datetime
-from models.commons import Recipe, MealType, NutritionalInfo
+from models.commons import Recipe, MealType, NutritionalInfo, utc_now
 
 class DishStatus(str, Enum):
     """
@@ -16,6 +17,9 @@ class DishStatus(str, Enum):
     ACTIVE = "active"
     INACTIVE = "inactive"
 
+# DishStatus values as a plain string type, for query-string filters
+DishStatusValue = Literal["active", "inactive"]
+
 class DishType(str, Enum):
     """
     Dish type categories for nutritional classification.
@@ -75,18 +79,45 @@ class DishUpdate(BaseModel):
 
 class Dish(Document, DishBase):
     name: Indexed(str, unique=True) = Field(..., min_length=1, max_length=255)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    name_lc: Optional[str] = Field(None, description="Case-folded name used for case-insensitive search")
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
     class Settings:
         name = "dishes"
         indexes = [
             "name",
             "status",
+            IndexModel([("name_lc", 1)]),
+            # Whole-word search fallback of name_search_filter
+            IndexModel([("name", TEXT)], name="name_text", default_language="none"),
+        ]
+
+    @before_event(Insert, Replace, Save, SaveChanges)
+    def sync_name_lc(self):
+        """Keep the case-folded search key in step with `name`"""
+        self.name_lc = self.name.casefold()
+
+    @classmethod
+    async def backfill_name_lc(cls) -> int:
+        """
+        Populate `name_lc` on dishes stored before the field existed.
+
+        Returns:
+            int: Number of documents updated
+        """
+        collection = cls.get_motor_collection()
+        requests = [
+            UpdateOne({"_id": doc["_id"]}, {"$set": {"name_lc": doc["name"].casefold()}})
+            async for doc in collection.find({"name_lc": None}, {"name": 1})
         ]
+        if not requests:
+            return 0
+        result = await collection.bulk_write(requests, ordered=False)
+        return result.modified_count
     
     def update_timestamp(self):
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
 
 class DishResponse(DishBase):
@@ -96,4 +127,5 @@ class DishResponse(DishBase):
     associated_menus: List[dict] = Field(default=[], description="Placeholder for associated menus")
 
     class Config:
-        populate_by_name = True 
\ No newline at end of file
+        populate_by_name = True
+        defer_build = True 
\ No newline at end of file
@@ -1,8 +1,12 @@
-from beanie import Document, Indexed
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from beanie import Document, Indexed, Insert, Replace, Save, SaveChanges, before_event
+from pymongo import ASCENDING, TEXT, IndexModel, UpdateOne
+from pymongo.errors import DuplicateKeyError
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import ClassVar, Dict, Literal, Optional, List
 from enum import Enum
 from datetime import datetime
+from models.commons import utc_now
+from core.config import settings
 
 
 class IngredientStatus(str, Enum):
@@ -17,8 +21,14 @@ class IngredientStatus(str, Enum):
     INACTIVE = "inactive"
 
 
+# IngredientStatus values as a plain string type, for query-string filters
+IngredientStatusValue = Literal["active", "inactive"]
+
+
 class MenuUsageInfo(BaseModel):
     """Menu usage information for an ingredient"""
+    model_config = ConfigDict(frozen=True)
+
     dish_count: int = Field(0, description="Number of dishes using this ingredient")
     menu_cycle_count: int = Field(0, description="Number of menu cycles using this ingredient")
     dish_names: List[str] = Field(default=[], description="Names of dishes using this ingredient")
@@ -79,21 +89,120 @@ class IngredientUpdate(BaseModel):
 class Ingredient(Document, IngredientBase):
     """Ingredient document model for MongoDB"""
     name: Indexed(str, unique=True) = Field(..., min_length=1, max_length=255)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    name_lc: Optional[str] = Field(None, description="Case-folded name used for case-insensitive search")
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
     
+    NAME_LC_INDEX: ClassVar[str] = "name_lc_1"
+
     class Settings:
         name = "ingredients"
+        # `name` is already covered by the unique Indexed field and `status`
+        # by the prefix of the compound indexes below. The unique name_lc
+        # index is checked at startup by ensure_name_lc_index instead, since
+        # legacy data has to be migrated before it can be built.
         indexes = [
-            "name",
-            "status",
+            IndexModel([("status", 1), ("category", 1)]),
+            IndexModel([("status", 1), ("name", 1)]),
+            # Whole-word search fallback of name_search_filter; no language,
+            # so Spanish names are neither stemmed nor stripped of stop words
+            IndexModel([("name", TEXT)], name="name_text", default_language="none"),
             "category",
             "created_at"
         ]
 
-    def update_timestamp(self):
-        """Update the updated_at timestamp"""
-        self.updated_at = datetime.utcnow()
+    @before_event(Insert, Replace, Save, SaveChanges)
+    def sync_name_lc(self):
+        """Keep the case-folded search key in step with `name`"""
+        self.name_lc = self.name.casefold()
+
+    @classmethod
+    async def find_name_lc_collisions(cls) -> List[List[str]]:
+        """
+        Group the stored names that only differ in letter case.
+
+        Reads every ingredient name, so it is meant for the one-off
+        scripts.backfill_name_lc migration rather than for startup.
+
+        Returns:
+            List[List[str]]: One list of names per colliding case-folded name
+        """
+        names_by_key: Dict[str, List[str]] = {}
+        async for doc in cls.get_motor_collection().find({}, {"name": 1}):
+            names_by_key.setdefault(doc["name"].casefold(), []).append(doc["name"])
+        return [names for names in names_by_key.values() if len(names) > 1]
+
+    @classmethod
+    async def backfill_name_lc(cls) -> int:
+        """
+        Populate `name_lc` on documents stored before the field existed.
+
+        Case folding is done in Python rather than with `$toLower`, which only
+        handles ASCII and would miss accented names. Run by
+        scripts.backfill_name_lc once find_name_lc_collisions comes back empty.
+
+        Returns:
+            int: Number of documents updated
+        """
+        collection = cls.get_motor_collection()
+        requests = [
+            UpdateOne({"_id": doc["_id"]}, {"$set": {"name_lc": doc["name"].casefold()}})
+            async for doc in collection.find({"name_lc": None}, {"name": 1})
+        ]
+        if not requests:
+            return 0
+        result = await collection.bulk_write(requests, ordered=False)
+        return result.modified_count
+
+    @classmethod
+    async def ensure_name_lc_index(cls, replace_non_unique: bool = False) -> None:
+        """
+        Make sure names are unique regardless of letter case.
+
+        Creates the unique name_lc index if it is missing. Nothing is
+        dropped unless `replace_non_unique` is set, which only the migration
+        script does.
+
+        Args:
+            replace_non_unique: Rebuild an existing non-unique name_lc index
+                as a unique one
+
+        Raises:
+            RuntimeError: If some ingredient has no `name_lc` yet, the index
+                is not unique, or stored names collide by letter case; run
+                `poe backfill-names` to migrate the data
+        """
+        collection = cls.get_motor_collection()
+        if await collection.count_documents({"name_lc": None}, limit=1):
+            raise RuntimeError(
+                "Some ingredients have no case-folded name yet; run `poe backfill-names`"
+            )
+
+        index = (await collection.index_information()).get(cls.NAME_LC_INDEX)
+        if index is not None and index.get("unique"):
+            return
+        if index is not None:
+            if not replace_non_unique:
+                raise RuntimeError(
+                    f"Index {cls.NAME_LC_INDEX} on ingredients is not unique; run `poe backfill-names`"
+                )
+            await collection.drop_index(cls.NAME_LC_INDEX)
+        if settings.DB_SKIP_INDEXES:
+            raise RuntimeError(
+                f"Unique index {cls.NAME_LC_INDEX} on ingredients is missing and DB_SKIP_INDEXES is set"
+            )
+        try:
+            await collection.create_index(
+                [("name_lc", ASCENDING)], name=cls.NAME_LC_INDEX, unique=True
+            )
+        except DuplicateKeyError as e:
+            raise RuntimeError(
+                "Ingredient names collide by letter case; run `poe backfill-names` to list them"
+            ) from e
+
+    def update_timestamp(self, now: Optional[datetime] = None):
+        """Update the updated_at timestamp, optionally to a shared `now` for bulk updates"""
+        self.updated_at = now or utc_now()
 
 
 class IngredientResponse(IngredientBase):
@@ -102,8 +211,7 @@ class IngredientResponse(IngredientBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True, defer_build=True)
 
 
 class IngredientDetailedResponse(IngredientBase):
@@ -113,5 +221,4 @@ class IngredientDetailedResponse(IngredientBase):
     updated_at: datetime
     menu_usage: MenuUsageInfo = Field(default_factory=MenuUsageInfo, description="Menu usage details")
 
-    class Config:
-        populate_by_name = True 
\ No newline at end of file
+    model_config = ConfigDict(populate_by_name=True, frozen=True, defer_build=True) 
\ No newline at end of file
@@ -1,9 +1,9 @@
 from beanie import Document, Indexed, PydanticObjectId
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List
 from enum import Enum
 from datetime import datetime
-from models.commons import DailyMenu
+from models.commons import DailyMenu, utc_now
 
 class MenuCycleStatus(str, Enum):
     ACTIVE = "active"
@@ -45,8 +45,8 @@ class MenuCycleUpdate(BaseModel):
 
 class MenuCycle(Document, MenuCycleBase):
     name: Indexed(str, unique=True) = Field(..., min_length=1, max_length=255)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
     class Settings:
         name = "menu_cycles"
@@ -57,13 +57,13 @@ class MenuCycle(Document, MenuCycleBase):
         ]
 
     def update_timestamp(self):
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
 
 class MenuCycleResponse(MenuCycleBase):
-    id: PydanticObjectId = Field(alias="_id")
+    # Built from documents by field name, only rendered as `_id`
+    id: PydanticObjectId = Field(serialization_alias="_id")
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        populate_by_name = True 
\ No newline at end of file
+    model_config = ConfigDict(defer_build=True) 
\ No newline at end of file
@@ -1,8 +1,10 @@
 from beanie import Document, Indexed, PydanticObjectId
+from pymongo import IndexModel
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 from enum import Enum
 from datetime import date, datetime
+from models.commons import utc_now
 
 class MenuScheduleStatus(str, Enum):
     ACTIVE = "active"
@@ -21,7 +23,7 @@ class Coverage(BaseModel):
 
 class CancellationInfo(BaseModel):
     reason: Optional[str] = Field(None, description="Reason for cancellation")
-    cancelled_at: datetime = Field(default_factory=datetime.utcnow)
+    cancelled_at: datetime = Field(default_factory=utc_now)
     # user_id: Optional[str] = Field(None, description="User who cancelled the schedule")
 
 
@@ -91,8 +93,8 @@ class MenuScheduleUpdate(BaseModel):
 
 
 class MenuSchedule(Document, MenuScheduleBase):
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
 
     class Settings:
         name = "menu_schedules"
@@ -100,11 +102,22 @@ class MenuSchedule(Document, MenuScheduleBase):
             "menu_cycle_id",
             "start_date",
             "end_date",
-            "status",
+            # Also serves plain `status` lookups. Status-filtered pages walk
+            # it in list order (newest first), so after_id seeks and no
+            # in-memory sort is needed
+            IndexModel([("status", 1), ("_id", -1)]),
+            # Citizen menu lookups and overlap checks match a location and
+            # status, then a date range: equality keys first, ranges last
+            IndexModel([
+                ("coverage.location_id", 1),
+                ("status", 1),
+                ("start_date", 1),
+                ("end_date", 1),
+            ]),
         ]
 
     def update_timestamp(self):
-        self.updated_at = datetime.utcnow()
+        self.updated_at = utc_now()
 
 class MenuScheduleResponse(MenuScheduleBase):
     id: PydanticObjectId = Field(alias="_id")
@@ -114,6 +127,18 @@ class MenuScheduleResponse(MenuScheduleBase):
     class Config:
         populate_by_name = True 
 
+class MenuScheduleListItem(BaseModel):
+    """Compact schedule entry for list views, without coverage or cancellation details"""
+    id: PydanticObjectId = Field(alias="_id")
+    menu_cycle_id: PydanticObjectId
+    start_date: date
+    end_date: date
+    status: MenuScheduleStatus
+    updated_at: datetime
+
+    class Config:
+        populate_by_name = True
+
 class LocationInfo(BaseModel):
     id: str
     name: str
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, List, Optional
 from datetime import date as Date
 from enum import Enum
@@ -34,6 +34,8 @@ class FoodGroupPortion(BaseModel):
 
 class NutrientSummary(BaseModel):
     """Summary of key nutrients"""
+    model_config = ConfigDict(defer_build=True)
+
     total_calories: float = Field(0.0, description="Total calories per person per day")
     total_protein: float = Field(0.0, description="Total protein in grams per person per day")
     total_carbohydrates: float = Field(0.0, description="Total carbohydrates in grams per person per day")
@@ -45,6 +47,10 @@ class NutrientSummary(BaseModel):
     total_vitamin_a: float = Field(0.0, description="Total vitamin A in IU per person per day")
 
 
+# NutrientSummary field names in declaration order, for column-wise totals
+NUTRIENT_KEYS = tuple(NutrientSummary.model_fields)
+
+
 class DailyNutritionalAnalysis(BaseModel):
     """Nutritional analysis for a specific day"""
     date: Date = Field(..., description="Date of the analysis")
@@ -56,6 +62,8 @@ class DailyNutritionalAnalysis(BaseModel):
 
 class NutritionalAnalysisReport(BaseModel):
     """Complete nutritional analysis report for a menu schedule"""
+    model_config = ConfigDict(defer_build=True)
+
     menu_schedule_id: str = Field(..., description="ID of the menu schedule")
     menu_cycle_name: str = Field(..., description="Name of the menu cycle")
     analysis_period: dict = Field(..., description="Analysis period with start and end dates")
@@ -84,6 +92,8 @@ class SimplifiedNutritionalSummary(BaseModel):
     
 class NutritionalRequirements(BaseModel):
     """Nutritional requirements for comparison"""
+    model_config = ConfigDict(defer_build=True)
+
     age_group: str = Field(..., description="Age group (e.g., 'school_age_6_12')")
     daily_calories: float = Field(..., description="Required daily calories")
     daily_protein: float = Field(..., description="Required daily protein in grams")
@@ -95,6 +105,8 @@ class NutritionalRequirements(BaseModel):
     
 class NutritionalComparisonReport(BaseModel):
     """Comparison report between actual intake and requirements"""
+    model_config = ConfigDict(defer_build=True)
+
     menu_schedule_id: str = Field(..., description="ID of the menu schedule")
     requirements: NutritionalRequirements = Field(..., description="Nutritional requirements")
     actual_intake: NutrientSummary = Field(..., description="Actual average daily intake")
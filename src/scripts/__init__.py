@@ -0,0 +1 @@
+# pae_menus/scripts/__init__.py
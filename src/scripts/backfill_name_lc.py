@@ -0,0 +1,46 @@
+"""
+Backfill the case-folded `name_lc` search key and make it unique for ingredients.
+
+Run once, with the API stopped, after upgrading from a version without
+`name_lc`:
+
+    poetry run poe backfill-names
+
+Ingredients whose names only differ in letter case are listed and the script
+exits with status 1 without touching the data or the index; rename them and
+run it again. The API refuses to start until this has succeeded.
+"""
+import asyncio
+import logging
+import sys
+
+from database import init_db, close_db_connection
+from models import Ingredient, Dish
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> int:
+    await init_db()
+    try:
+        collisions = await Ingredient.find_name_lc_collisions()
+        if collisions:
+            for names in collisions:
+                logger.error(f"Ingredient names differing only in letter case: {', '.join(names)}")
+            logger.error("Rename these ingredients and run the backfill again.")
+            return 1
+
+        for model in (Ingredient, Dish):
+            backfilled = await model.backfill_name_lc()
+            logger.info(f"Backfilled search names for {backfilled} {model.Settings.name}.")
+
+        await Ingredient.ensure_name_lc_index(replace_non_unique=True)
+        logger.info(f"Unique index {Ingredient.NAME_LC_INDEX} on ingredients is in place.")
+        return 0
+    finally:
+        await close_db_connection()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(main()))
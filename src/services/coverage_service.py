@@ -1,4 +1,5 @@
 import aiohttp
+import asyncio
 import logging
 import os
 from typing import List, Optional, Dict, Any
@@ -39,6 +40,8 @@ class CoverageService:
     def __init__(self, base_url: str = "http://127.0.0.1:8000"):
         self.base_url = base_url
         self.api_base = f"{base_url}/api/v1"
+        # Lookups currently in flight, keyed by endpoint, shared by concurrent callers
+        self._in_flight: Dict[str, "asyncio.Future[Dict[Any, Any]]"] = {}
 
     async def get_auth_admin_token(self, **kwargs) -> str:
         NUTRIPAE_AUTH_HOST = os.getenv("NUTRIPAE_AUTH_HOST", "nutripae-auth-api")
@@ -118,6 +121,22 @@ class CoverageService:
                 detail="Cannot connect to coverage service",
             )
 
+    async def _get_coalesced(self, endpoint: str) -> Dict[Any, Any]:
+        """
+        GET an endpoint, sharing the call with concurrent requests for it
+
+        The coverage service has no bulk lookup, so concurrent validations of
+        the same town or campus wait on a single HTTP call instead of each
+        making their own.
+        """
+        request = self._in_flight.get(endpoint)
+        if request is None:
+            request = asyncio.ensure_future(self._make_request(endpoint))
+            self._in_flight[endpoint] = request
+            request.add_done_callback(lambda _: self._in_flight.pop(endpoint, None))
+        # A cancelled caller must not cancel the call the others are waiting on
+        return await asyncio.shield(request)
+
     async def get_towns(self, skip: int = 0, limit: int = 1000) -> List[TownInfo]:
         """Get all towns from coverage service"""
         data = await self._make_request("towns/", params={"skip": skip, "limit": limit})
@@ -125,7 +144,7 @@ class CoverageService:
 
     async def get_town_by_id(self, town_id: int) -> TownInfo:
         """Get a specific town by ID"""
-        data = await self._make_request(f"towns/{town_id}")
+        data = await self._get_coalesced(f"towns/{town_id}")
         return TownInfo(**data)
 
     async def get_campuses(self, skip: int = 0, limit: int = 1000) -> List[CampusInfo]:
@@ -137,7 +156,7 @@ class CoverageService:
 
     async def get_campus_by_id(self, campus_id: int) -> CampusInfo:
         """Get a specific campus by ID"""
-        data = await self._make_request(f"campuses/{campus_id}")
+        data = await self._get_coalesced(f"campuses/{campus_id}")
         return CampusInfo(**data)
 
     async def get_institutions(
@@ -155,32 +174,34 @@ class CoverageService:
         return InstitutionInfo(**data)
 
     async def validate_campus_ids(self, campus_ids: List[str]) -> List[CampusInfo]:
-        """Validate that campus IDs exist and return their info"""
-        validated_campuses = []
+        """Validate that campus IDs exist and return their info, fetching them concurrently"""
+        parsed_ids = []
         for campus_id in campus_ids:
             try:
-                campus = await self.get_campus_by_id(int(campus_id))
-                validated_campuses.append(campus)
+                parsed_ids.append(int(campus_id))
             except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid campus ID format: {campus_id}",
                 )
-        return validated_campuses
+        return list(await asyncio.gather(
+            *(self.get_campus_by_id(campus_id) for campus_id in parsed_ids)
+        ))
 
     async def validate_town_ids(self, town_ids: List[str]) -> List[TownInfo]:
-        """Validate that town IDs exist and return their info"""
-        validated_towns = []
+        """Validate that town IDs exist and return their info, fetching them concurrently"""
+        parsed_ids = []
         for town_id in town_ids:
             try:
-                town = await self.get_town_by_id(int(town_id))
-                validated_towns.append(town)
+                parsed_ids.append(int(town_id))
             except ValueError:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid town ID format: {town_id}",
                 )
-        return validated_towns
+        return list(await asyncio.gather(
+            *(self.get_town_by_id(town_id) for town_id in parsed_ids)
+        ))
 
 
 # Create singleton instance
@@ -1,8 +1,8 @@
 from beanie import PydanticObjectId, Document
-from typing import List, Optional
-from models.dish import Dish, DishCreate, DishUpdate, DishStatus
+from typing import AsyncIterator, List, Optional
+from models.dish import Dish, DishCreate, DishUpdate, DishStatus, DishResponse
 from models.ingredient import Ingredient, IngredientStatus
-from models.commons import Recipe, MealType
+from models.commons import Recipe, MealType, name_search_filter
 
 class DishService:
     async def create_dish(self, dish_data: DishCreate) -> Dish:
@@ -38,16 +38,45 @@ class DishService:
         """
         Retrieves all dishes, with optional filtering.
         """
+        return await Dish.find(self._build_list_query(name, status, meal_type)).to_list()
+
+    async def stream_dishes(
+        self,
+        name: Optional[str] = None,
+        status: Optional[DishStatus] = None,
+        meal_type: Optional[MealType] = None
+    ) -> AsyncIterator[DishResponse]:
+        """
+        Iterates over all matching dishes straight from the database cursor.
+        Raw documents are projected and parsed directly into DishResponse,
+        skipping the intermediate Dish document.
+        """
+        async for dish in Dish.find(
+            self._build_list_query(name, status, meal_type),
+            projection_model=DishResponse,
+            batch_size=500
+        ):
+            yield dish
+
+    def _build_list_query(
+        self,
+        name: Optional[str] = None,
+        status: Optional[DishStatus] = None,
+        meal_type: Optional[MealType] = None
+    ) -> dict:
+        """
+        Builds the MongoDB filter used to list dishes.
+        """
         query = {}
         if name:
-            query["name"] = {"$regex": name, "$options": "i"}
+            # Prefix range on name_lc, whole words through the text index
+            query.update(name_search_filter(name))
         if status:
             query["status"] = status
         if meal_type:
             # This query finds dishes where the meal_type is present in the compatible_meal_types list
             query["compatible_meal_types"] = meal_type
-            
-        return await Dish.find(query).to_list()
+        return query
 
     async def update_dish(self, dish_id: PydanticObjectId, dish_data: DishUpdate) -> Optional[Dish]:
         """
@@ -152,19 +181,20 @@ class DishService:
         if not recipe_ingredients:
             return
 
-        ingredient_ids = [item.ingredient_id for item in recipe_ingredients]
+        required_ids = {item.ingredient_id for item in recipe_ingredients}
         
-        # Use a direct PyMongo query for maximum robustness
+        # Use a direct PyMongo query for maximum robustness, fetching only
+        # the fields needed to report missing or inactive ingredients
         ingredients_collection = Ingredient.get_motor_collection()
         
-        ingredients_in_db_cursor = ingredients_collection.find({
-            "_id": {"$in": ingredient_ids}
-        })
+        ingredients_in_db_cursor = ingredients_collection.find(
+            {"_id": {"$in": list(required_ids)}},
+            {"_id": 1, "name": 1, "status": 1}
+        )
         
-        ingredients_in_db = await ingredients_in_db_cursor.to_list(length=len(ingredient_ids))
+        ingredients_in_db = await ingredients_in_db_cursor.to_list(length=len(required_ids))
 
         found_ids = {ing["_id"] for ing in ingredients_in_db}
-        required_ids = set(ingredient_ids)
 
         if missing_ids := required_ids - found_ids:
             # Convert ObjectIds to strings for a cleaner error message
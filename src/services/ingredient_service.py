@@ -1,5 +1,5 @@
 # pae_menus/services/ingredient_service.py
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 from beanie import PydanticObjectId
 from fastapi import HTTPException, status
 from pymongo.errors import DuplicateKeyError
@@ -14,13 +14,56 @@ from models.ingredient import (
     MenuUsageInfo,
     IngredientStatus
 )
+from models.commons import name_search_filter
 from models.dish import Dish
 from models.menu_cycle import MenuCycle
+from core.config import settings
+from utils.cache import TTLCache
 
 
 class IngredientService:
     """Service class for ingredient management operations"""
 
+    # Categories in use, loaded once with distinct and kept current by the write
+    # methods below; None means it has to be (re)loaded
+    _categories_cache: Optional[Set[str]] = None
+
+    # Responses of get_ingredient_by_id keyed by the 12-byte ObjectId; entries
+    # are dropped by every method that changes or removes an ingredient
+    _ingredient_cache = TTLCache(ttl=settings.ITEM_CACHE_TTL_SECONDS, maxsize=4096)
+
+    # Name uniqueness results keyed by (case-folded name, excluded ID), for the
+    # per-keystroke checks of the UI; cleared whenever a name can change
+    _name_check_cache = TTLCache(ttl=settings.NAME_CHECK_CACHE_TTL_SECONDS, maxsize=4096)
+
+    @staticmethod
+    def _to_response(ingredient: Ingredient) -> IngredientResponse:
+        """
+        Build a response from a stored ingredient without re-validating it
+
+        Args:
+            ingredient: An ingredient document loaded from or written to the database
+
+        Returns:
+            IngredientResponse: The ingredient response
+        """
+        return IngredientResponse.model_construct(**{**dict(ingredient), "id": str(ingredient.id)})
+
+    @staticmethod
+    async def _get_categories() -> Set[str]:
+        """Return the cached set of non-empty categories, loading it if needed"""
+        if IngredientService._categories_cache is None:
+            categories = await Ingredient.distinct("category")
+            # Filter out None values and empty strings
+            IngredientService._categories_cache = {cat for cat in categories if cat and cat.strip()}
+        return IngredientService._categories_cache
+
+    @staticmethod
+    def _remember_category(category: Optional[str]) -> None:
+        """Add a newly used category to the cache if it is loaded"""
+        if IngredientService._categories_cache is not None and category and category.strip():
+            IngredientService._categories_cache.add(category)
+
     @staticmethod
     async def create_ingredient(ingredient_data: IngredientCreate) -> IngredientResponse:
         """
@@ -36,17 +79,12 @@ class IngredientService:
             HTTPException: If name already exists or creation fails
         """
         try:
-            # Check if ingredient with same name already exists
-            existing = await Ingredient.find_one({"name": {"$regex": f"^{ingredient_data.name}$", "$options": "i"}})
-            if existing:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Ingredient with name '{ingredient_data.name}' already exists"
-                )
-            
-            # Create new ingredient
+            # Create new ingredient; a name that is already taken, in any letter
+            # case, is rejected by the unique name_lc index (DuplicateKeyError)
             ingredient = Ingredient(**ingredient_data.model_dump())
             await ingredient.insert()
+            IngredientService._remember_category(ingredient.category)
+            IngredientService._name_check_cache.clear()
             
             # Refresh from database to ensure consistency
             created_ingredient = await Ingredient.get(ingredient.id)
@@ -56,10 +94,7 @@ class IngredientService:
                     detail="Failed to create ingredient - database consistency error"
                 )
             
-            return IngredientResponse(
-                id=str(created_ingredient.id),
-                **created_ingredient.model_dump(exclude={"id"})
-            )
+            return IngredientService._to_response(created_ingredient)
             
         except DuplicateKeyError:
             raise HTTPException(
@@ -85,46 +120,149 @@ class IngredientService:
                 detail=f"Error creating ingredient: {str(e)}"
             )
 
+    @staticmethod
+    def _build_list_query(
+        status_filter: Optional[str] = None,
+        category_filter: Optional[str] = None,
+        search: Optional[str] = None,
+        after_id: Optional[PydanticObjectId] = None
+    ) -> dict:
+        """
+        Build the MongoDB filter used to list ingredients
+        
+        Args:
+            status_filter: Filter by ingredient status
+            category_filter: Filter by ingredient category
+            search: Search term for ingredient name; matches names starting
+                with it or containing it as whole words, see name_search_filter
+            after_id: Keyset cursor; only ingredients with a greater ID match
+            
+        Returns:
+            dict: The query filter
+        """
+        query = {}
+        
+        if status_filter:
+            query["status"] = status_filter
+            
+        if category_filter:
+            query["category"] = category_filter
+            
+        if search:
+            query.update(name_search_filter(search))
+
+        if after_id:
+            # Seek on the _id index instead of walking `skip` entries
+            query["_id"] = {"$gt": after_id}
+
+        return query
+
+    @staticmethod
+    async def stream_ingredients(
+        skip: int = 0,
+        limit: int = 100,
+        status_filter: Optional[str] = None,
+        category_filter: Optional[str] = None,
+        search: Optional[str] = None,
+        after_id: Optional[PydanticObjectId] = None
+    ) -> AsyncIterator[IngredientResponse]:
+        """
+        Iterate ingredients straight from the database cursor, ordered by ID
+        
+        Args:
+            skip: Number of records to skip (ignored when after_id is given)
+            limit: Maximum number of records to return
+            status_filter: Filter by ingredient status
+            category_filter: Filter by ingredient category
+            search: Search term for ingredient name
+            after_id: Keyset cursor; only ingredients with a greater ID are returned
+            
+        Yields:
+            IngredientResponse: One ingredient at a time
+        """
+        query = IngredientService._build_list_query(
+            status_filter, category_filter, search, after_id
+        )
+        ingredients = Ingredient.find(
+            query,
+            skip=0 if after_id else skip,
+            limit=limit,
+            batch_size=500
+        ).sort("_id")
+        async for ingredient in ingredients:
+            yield IngredientService._to_response(ingredient)
+
+    @staticmethod
+    async def stream_ingredient_fields(
+        fields: Tuple[str, ...],
+        skip: int = 0,
+        limit: int = 100,
+        status_filter: Optional[str] = None,
+        category_filter: Optional[str] = None,
+        search: Optional[str] = None,
+        after_id: Optional[PydanticObjectId] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate only the requested fields of each ingredient, ordered by ID
+        
+        The projection is applied by MongoDB and the raw documents are yielded
+        as they are, so unrequested fields are neither transferred nor decoded.
+        
+        Args:
+            fields: Stored field names to return; `_id` is always included
+            skip: Number of records to skip (ignored when after_id is given)
+            limit: Maximum number of records to return
+            status_filter: Filter by ingredient status
+            category_filter: Filter by ingredient category
+            search: Search term for ingredient name
+            after_id: Keyset cursor; only ingredients with a greater ID are returned
+            
+        Yields:
+            Dict[str, Any]: The selected fields of one ingredient, with `_id` as a string
+        """
+        query = IngredientService._build_list_query(
+            status_filter, category_filter, search, after_id
+        )
+        documents = Ingredient.get_motor_collection().find(
+            query,
+            dict.fromkeys(fields, 1),
+            skip=0 if after_id else skip,
+            limit=limit,
+            batch_size=500
+        ).sort("_id", 1)
+        async for document in documents:
+            document["_id"] = str(document["_id"])
+            yield document
+
     @staticmethod
     async def get_active_ingredients(
         skip: int = 0, 
         limit: int = 100, 
         category_filter: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        after_id: Optional[PydanticObjectId] = None
     ) -> List[IngredientResponse]:
         """
-        Get only active ingredients available for menu creation.
+        Get only active ingredients available for menu creation, ordered by ID.
         This method specifically filters out inactive ingredients to ensure
         they don't appear when creating new menus.
         
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is given)
             limit: Maximum number of records to return
             category_filter: Filter by ingredient category
             search: Search term for ingredient name
+            after_id: Keyset cursor; only ingredients with a greater ID are returned
             
         Returns:
             List[IngredientResponse]: List of active ingredients only
         """
         try:
-            # Build query - always filter for active status
-            query = {"status": IngredientStatus.ACTIVE.value}
-            
-            if category_filter:
-                query["category"] = category_filter
-                
-            if search:
-                query["name"] = {"$regex": search, "$options": "i"}
-            
-            # Execute query
-            ingredients = await Ingredient.find(query).skip(skip).limit(limit).to_list()
-            
             return [
-                IngredientResponse(
-                    id=str(ingredient.id),
-                    **ingredient.model_dump(exclude={"id"})
+                ingredient
+                async for ingredient in IngredientService.stream_ingredients(
+                    skip, limit, IngredientStatus.ACTIVE.value, category_filter, search, after_id
                 )
-                for ingredient in ingredients
             ]
             
         except Exception as e:
@@ -141,43 +279,29 @@ class IngredientService:
         limit: int = 100, 
         status_filter: Optional[str] = None,
         category_filter: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        after_id: Optional[PydanticObjectId] = None
     ) -> List[IngredientResponse]:
         """
-        Get all ingredients with optional filtering and pagination
+        Get all ingredients with optional filtering and pagination, ordered by ID
         
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is given)
             limit: Maximum number of records to return
             status_filter: Filter by ingredient status
             category_filter: Filter by ingredient category
             search: Search term for ingredient name
+            after_id: Keyset cursor; only ingredients with a greater ID are returned
             
         Returns:
             List[IngredientResponse]: List of ingredients
         """
         try:
-            # Build query
-            query = {}
-            
-            if status_filter:
-                query["status"] = status_filter
-                
-            if category_filter:
-                query["category"] = category_filter
-                
-            if search:
-                query["name"] = {"$regex": search, "$options": "i"}
-            
-            # Execute query
-            ingredients = await Ingredient.find(query).skip(skip).limit(limit).to_list()
-            
             return [
-                IngredientResponse(
-                    id=str(ingredient.id),
-                    **ingredient.model_dump(exclude={"id"})
+                ingredient
+                async for ingredient in IngredientService.stream_ingredients(
+                    skip, limit, status_filter, category_filter, search, after_id
                 )
-                for ingredient in ingredients
             ]
             
         except Exception as e:
@@ -210,18 +334,10 @@ class IngredientService:
                     detail=f"Ingredient with id '{ingredient_id}' not found"
                 )
             
-            # Check name uniqueness if name is being updated
+            # A new name that is already taken is rejected by the unique
+            # name_lc index when saving (DuplicateKeyError)
             update_data = ingredient_data.model_dump(exclude_unset=True)
-            if "name" in update_data and update_data["name"] != ingredient.name:
-                existing = await Ingredient.find_one({
-                    "name": {"$regex": f"^{update_data['name']}$", "$options": "i"},
-                    "_id": {"$ne": ingredient.id}
-                })
-                if existing:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Ingredient with name '{update_data['name']}' already exists"
-                    )
+            previous_category = ingredient.category
             
             # Update ingredient
             for field, value in update_data.items():
@@ -229,12 +345,20 @@ class IngredientService:
             
             ingredient.update_timestamp()
             await ingredient.save()
+            IngredientService._ingredient_cache.pop(ingredient.id.binary)
+            IngredientService._name_check_cache.clear()
             
-            return IngredientResponse(
-                id=str(ingredient.id),
-                **ingredient.model_dump(exclude={"id"})
-            )
+            # The previous category may no longer be in use, so reload it lazily
+            if ingredient.category != previous_category:
+                IngredientService._categories_cache = None
+            
+            return IngredientService._to_response(ingredient)
             
+        except DuplicateKeyError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Ingredient with name '{ingredient_data.name or ingredient.name}' already exists"
+            )
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -283,6 +407,10 @@ class IngredientService:
                 )
             
             await ingredient.delete()
+            IngredientService._ingredient_cache.pop(ingredient.id.binary)
+            IngredientService._name_check_cache.clear()
+            if ingredient.category:
+                IngredientService._categories_cache = None
             return {"message": f"Ingredient '{ingredient.name}' deleted successfully"}
             
         except ValueError:
@@ -311,13 +439,23 @@ class IngredientService:
             bool: True if name is unique, False otherwise
         """
         try:
-            query = {"name": {"$regex": f"^{name}$", "$options": "i"}}
+            name_lc = name.strip().casefold()
+            cache_key = (name_lc, exclude_id)
+            is_unique = IngredientService._name_check_cache.get(cache_key)
+            if is_unique is not None:
+                return is_unique
+
+            # Exact match on the indexed case-folded name; only a count is
+            # returned, so no document is decoded
+            query = {"name_lc": name_lc}
             
             if exclude_id:
                 query["_id"] = {"$ne": PydanticObjectId(exclude_id)}
             
-            existing = await Ingredient.find_one(query)
-            return existing is None
+            existing_count = await Ingredient.get_motor_collection().count_documents(query, limit=1)
+            is_unique = existing_count == 0
+            IngredientService._name_check_cache.set(cache_key, is_unique)
+            return is_unique
             
         except Exception:
             return False
@@ -358,12 +496,17 @@ class IngredientService:
             ingredient.status = IngredientStatus.INACTIVE
             ingredient.update_timestamp()
             await ingredient.save()
+            IngredientService._ingredient_cache.pop(ingredient.id.binary)
             
-            return IngredientResponse(
-                id=str(ingredient.id),
-                **ingredient.model_dump(exclude={"id"})
-            )
+            return IngredientService._to_response(ingredient)
             
+        except DuplicateKeyError:
+            # Only if names were edited outside the API so that they collide
+            # by letter case; the unique name_lc index then rejects the save
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Ingredient '{ingredient.name}' shares its name with another ingredient in a different letter case; rename one of them first"
+            )
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -411,12 +554,17 @@ class IngredientService:
             ingredient.status = IngredientStatus.ACTIVE
             ingredient.update_timestamp()
             await ingredient.save()
+            IngredientService._ingredient_cache.pop(ingredient.id.binary)
             
-            return IngredientResponse(
-                id=str(ingredient.id),
-                **ingredient.model_dump(exclude={"id"})
-            )
+            return IngredientService._to_response(ingredient)
             
+        except DuplicateKeyError:
+            # Only if names were edited outside the API so that they collide
+            # by letter case; the unique name_lc index then rejects the save
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Ingredient '{ingredient.name}' shares its name with another ingredient in a different letter case; rename one of them first"
+            )
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -439,9 +587,7 @@ class IngredientService:
             List[str]: List of unique categories used by ingredients
         """
         try:
-            categories = await Ingredient.distinct("category")
-            # Filter out None values and empty strings
-            return [cat for cat in categories if cat and cat.strip()]
+            return sorted(await IngredientService._get_categories())
             
         except Exception as e:
             raise HTTPException(
@@ -458,18 +604,21 @@ class IngredientService:
             dict: Statistics including total count, active/inactive counts, categories count
         """
         try:
-            total_count = await Ingredient.count()
-            active_count = await Ingredient.find({"status": IngredientStatus.ACTIVE}).count()
-            inactive_count = await Ingredient.find({"status": IngredientStatus.INACTIVE}).count()
-            categories = await Ingredient.distinct("category")
-            category_count = len([cat for cat in categories if cat and cat.strip()])
+            # One pass counts every status; the total is their sum
+            status_counts = {
+                group["_id"]: group["count"]
+                async for group in Ingredient.get_motor_collection().aggregate(
+                    [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+                )
+            }
+            categories = sorted(await IngredientService._get_categories())
             
             return {
-                "total_ingredients": total_count,
-                "active_ingredients": active_count,
-                "inactive_ingredients": inactive_count,
-                "total_categories": category_count,
-                "categories": [cat for cat in categories if cat and cat.strip()]
+                "total_ingredients": sum(status_counts.values()),
+                "active_ingredients": status_counts.get(IngredientStatus.ACTIVE.value, 0),
+                "inactive_ingredients": status_counts.get(IngredientStatus.INACTIVE.value, 0),
+                "total_categories": len(categories),
+                "categories": categories
             }
             
         except Exception as e:
@@ -487,7 +636,7 @@ class IngredientService:
         search: Optional[str] = None
     ) -> List[IngredientDetailedResponse]:
         """
-        Get ingredients with detailed information including menu usage
+        Get ingredients with detailed information including menu usage, ordered by ID
         
         Args:
             skip: Number of records to skip
@@ -500,25 +649,19 @@ class IngredientService:
             List[IngredientDetailedResponse]: List of ingredients with menu usage details
         """
         try:
-            # Build query
-            query = {}
+            query = IngredientService._build_list_query(status_filter, category_filter, search)
             
-            if status_filter:
-                query["status"] = status_filter
-                
-            if category_filter:
-                query["category"] = category_filter
-                
-            if search:
-                query["name"] = {"$regex": search, "$options": "i"}
+            # skip/limit run in MongoDB; the sort keeps pages stable across requests
+            ingredients = await Ingredient.find(query, skip=skip, limit=limit).sort("_id").to_list()
             
-            # Execute query
-            ingredients = await Ingredient.find(query).skip(skip).limit(limit).to_list()
+            # Get menu usage for the whole page at once
+            usage_by_ingredient = await IngredientService._get_menu_usage_infos(
+                [ingredient.id for ingredient in ingredients]
+            )
             
-            # Get menu usage for each ingredient
             detailed_ingredients = []
             for ingredient in ingredients:
-                menu_usage = await IngredientService._get_menu_usage_info(ingredient.id)
+                menu_usage = usage_by_ingredient.get(ingredient.id, MenuUsageInfo())
                 
                 detailed_ingredients.append(
                     IngredientDetailedResponse(
@@ -591,49 +734,108 @@ class IngredientService:
         Returns:
             MenuUsageInfo: Usage information including dish count, menu cycles, etc.
         """
-        try:
-            # Find dishes that use this ingredient
-            dishes_using_ingredient = await Dish.find({
-                "recipe.ingredients.ingredient_id": ingredient_id,
-                "status": "active"
-            }).to_list()
-            
-            dish_names = [dish.name for dish in dishes_using_ingredient]
-            dish_count = len(dishes_using_ingredient)
-            
-            # Find menu cycles that include dishes using this ingredient
-            dish_ids = [dish.id for dish in dishes_using_ingredient]
-            
-            menu_cycles_count = 0
-            last_used_date = None
+        usage_by_ingredient = await IngredientService._get_menu_usage_infos([ingredient_id])
+        return usage_by_ingredient.get(ingredient_id, MenuUsageInfo())
+
+    @staticmethod
+    async def _get_menu_usage_infos(
+        ingredient_ids: List[PydanticObjectId]
+    ) -> Dict[PydanticObjectId, MenuUsageInfo]:
+        """
+        Get menu usage information for several ingredients with two queries
+        
+        Active dishes using any of the ingredients are fetched once, then the
+        menu cycles using any of those dishes, and usage is tallied per
+        ingredient in memory.
+        
+        Args:
+            ingredient_ids: The ingredient IDs to check usage for
             
+        Returns:
+            Dict[PydanticObjectId, MenuUsageInfo]: Usage information for each
+            ingredient that could be resolved; missing ingredients have no usage
+        """
+        if not ingredient_ids:
+            return {}
+        
+        try:
+            # Find active dishes that use any of these ingredients
+            dishes_using_ingredients = await Dish.get_motor_collection().find(
+                {
+                    "recipe.ingredients.ingredient_id": {"$in": ingredient_ids},
+                    "status": "active"
+                },
+                {"name": 1, "recipe.ingredients.ingredient_id": 1}
+            ).to_list(length=None)
+            
+            dishes_by_ingredient: Dict[PydanticObjectId, list] = {
+                ingredient_id: [] for ingredient_id in ingredient_ids
+            }
+            for dish in dishes_using_ingredients:
+                used_ids = {
+                    portion["ingredient_id"]
+                    for portion in dish.get("recipe", {}).get("ingredients", [])
+                }
+                for ingredient_id in used_ids:
+                    if ingredient_id in dishes_by_ingredient:
+                        dishes_by_ingredient[ingredient_id].append(dish)
+            
+            # Find menu cycles that include any of those dishes
+            dish_ids = [dish["_id"] for dish in dishes_using_ingredients]
+            menu_cycles = []
             if dish_ids:
-                # Query menu cycles that contain any of these dishes
-                menu_cycles = await MenuCycle.find({
-                    "$or": [
-                        {"daily_menus": {"$elemMatch": {"breakfast_dish_ids": {"$in": dish_ids}}}},
-                        {"daily_menus": {"$elemMatch": {"lunch_dish_ids": {"$in": dish_ids}}}},
-                        {"daily_menus": {"$elemMatch": {"snack_dish_ids": {"$in": dish_ids}}}}
-                    ]
-                }).to_list()
+                menu_cycles = await MenuCycle.get_motor_collection().find(
+                    {
+                        "$or": [
+                            {"daily_menus": {"$elemMatch": {"breakfast_dish_ids": {"$in": dish_ids}}}},
+                            {"daily_menus": {"$elemMatch": {"lunch_dish_ids": {"$in": dish_ids}}}},
+                            {"daily_menus": {"$elemMatch": {"snack_dish_ids": {"$in": dish_ids}}}}
+                        ]
+                    },
+                    {
+                        "updated_at": 1,
+                        "daily_menus.breakfast_dish_ids": 1,
+                        "daily_menus.lunch_dish_ids": 1,
+                        "daily_menus.snack_dish_ids": 1
+                    }
+                ).to_list(length=None)
+            
+            cycle_dish_ids = [
+                (
+                    {
+                        dish_id
+                        for daily_menu in cycle.get("daily_menus", [])
+                        for meal in ("breakfast_dish_ids", "lunch_dish_ids", "snack_dish_ids")
+                        for dish_id in daily_menu.get(meal, [])
+                    },
+                    cycle.get("updated_at")
+                )
+                for cycle in menu_cycles
+            ]
+            
+            usage_by_ingredient = {}
+            for ingredient_id, dishes in dishes_by_ingredient.items():
+                ingredient_dish_ids = {dish["_id"] for dish in dishes}
                 
-                menu_cycles_count = len(menu_cycles)
+                # Count the cycles using these dishes and find the most recent usage
+                cycle_dates = [
+                    updated_at
+                    for dish_ids_in_cycle, updated_at in cycle_dish_ids
+                    if not ingredient_dish_ids.isdisjoint(dish_ids_in_cycle)
+                ]
                 
-                # Find the most recent usage
-                if menu_cycles:
-                    latest_cycle = max(menu_cycles, key=lambda x: x.updated_at)
-                    last_used_date = latest_cycle.updated_at
-            
-            return MenuUsageInfo(
-                dish_count=dish_count,
-                menu_cycle_count=menu_cycles_count,
-                dish_names=dish_names,
-                last_used_date=last_used_date
-            )
+                usage_by_ingredient[ingredient_id] = MenuUsageInfo(
+                    dish_count=len(dishes),
+                    menu_cycle_count=len(cycle_dates),
+                    dish_names=[dish["name"] for dish in dishes],
+                    last_used_date=max(cycle_dates) if cycle_dates else None
+                )
+            
+            return usage_by_ingredient
             
         except Exception as e:
             # Return empty usage info if error occurs
-            return MenuUsageInfo()
+            return {}
 
     @staticmethod
     async def get_ingredient_by_id(ingredient_id: str) -> IngredientResponse:
@@ -650,17 +852,22 @@ class IngredientService:
             HTTPException: If ingredient not found
         """
         try:
-            ingredient = await Ingredient.get(PydanticObjectId(ingredient_id))
+            object_id = PydanticObjectId(ingredient_id)
+            cached_ingredient = IngredientService._ingredient_cache.get(object_id.binary)
+            if cached_ingredient is not None:
+                return cached_ingredient
+            
+            ingredient = await Ingredient.get(object_id)
             if not ingredient:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Ingredient with id '{ingredient_id}' not found"
                 )
             
-            return IngredientResponse(
-                id=str(ingredient.id),
-                **ingredient.model_dump(exclude={"id"})
-            )
+            # IngredientResponse is frozen, so the instance can be shared
+            ingredient_response = IngredientService._to_response(ingredient)
+            IngredientService._ingredient_cache.set(object_id.binary, ingredient_response)
+            return ingredient_response
             
         except ValueError:
             raise HTTPException(
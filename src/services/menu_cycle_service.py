@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from beanie import PydanticObjectId
 from fastapi import HTTPException, status
 from pymongo.errors import DuplicateKeyError
@@ -15,6 +15,19 @@ from models.menu_cycle import (
 class MenuCycleService:
     """Service class for menu cycle management operations"""
 
+    @staticmethod
+    def _to_response(menu_cycle: MenuCycle) -> MenuCycleResponse:
+        """
+        Build a response from a stored menu cycle without re-validating it
+
+        Args:
+            menu_cycle: A menu cycle document loaded from or written to the database
+
+        Returns:
+            MenuCycleResponse: The menu cycle response
+        """
+        return MenuCycleResponse.model_construct(**dict(menu_cycle))
+
     @staticmethod
     async def create_menu_cycle(menu_cycle_data: MenuCycleCreate) -> MenuCycleResponse:
         """
@@ -49,10 +62,7 @@ class MenuCycleService:
             menu_cycle = MenuCycle(**menu_cycle_data.model_dump())
             await menu_cycle.insert()
             
-            return MenuCycleResponse(
-                id=str(menu_cycle.id),
-                **menu_cycle.model_dump(exclude={"id"})
-            )
+            return MenuCycleService._to_response(menu_cycle)
             
         except DuplicateKeyError:
             raise HTTPException(
@@ -100,10 +110,7 @@ class MenuCycleService:
                     detail=f"Menu cycle with id '{menu_cycle_id}' not found"
                 )
             
-            return MenuCycleResponse(
-                id=str(menu_cycle.id),
-                **menu_cycle.model_dump(exclude={"id"})
-            )
+            return MenuCycleService._to_response(menu_cycle)
             
         except ValueError:
             raise HTTPException(
@@ -118,46 +125,64 @@ class MenuCycleService:
                 detail=f"Error retrieving menu cycle: {str(e)}"
             )
 
+    @staticmethod
+    def _build_list_query(
+        status_filter: Optional[str] = None,
+        search: Optional[str] = None,
+        after_id: Optional[PydanticObjectId] = None
+    ) -> dict:
+        """
+        Build the MongoDB filter used to list menu cycles
+        
+        Args:
+            status_filter: Filter by status
+            search: Search term for name
+            after_id: Keyset cursor; only menu cycles with a greater ID match
+            
+        Returns:
+            dict: The query filter
+        """
+        query = {}
+        
+        if status_filter:
+            query["status"] = status_filter
+            
+        if search:
+            query["name"] = {"$regex": search, "$options": "i"}
+
+        if after_id:
+            # Seek on the _id index instead of walking `skip` entries
+            query["_id"] = {"$gt": after_id}
+
+        return query
+
     @staticmethod
     async def get_all_menu_cycles(
         skip: int = 0,
         limit: int = 100,
         status_filter: Optional[str] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        after_id: Optional[PydanticObjectId] = None
     ) -> List[MenuCycleResponse]:
         """
-        Get all menu cycles with optional filtering
+        Get all menu cycles with optional filtering, ordered by ID
         
         Args:
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when after_id is given)
             limit: Maximum number of records to return
             status_filter: Filter by status
             search: Search term for name
+            after_id: Keyset cursor; only menu cycles with a greater ID are returned
             
         Returns:
             List[MenuCycleResponse]: List of menu cycles
         """
         try:
-            query = {}
-            
-            if status_filter:
-                query["status"] = status_filter
-                
-            if search:
-                query["name"] = {"$regex": search, "$options": "i"}
-            
-            menu_cycles = await MenuCycle.find(
-                query,
-                skip=skip,
-                limit=limit
-            ).to_list()
-            
             return [
-                MenuCycleResponse(
-                    id=str(menu_cycle.id),
-                    **menu_cycle.model_dump(exclude={"id"})
+                menu_cycle
+                async for menu_cycle in MenuCycleService.stream_menu_cycles(
+                    skip, limit, status_filter, search, after_id
                 )
-                for menu_cycle in menu_cycles
             ]
             
         except Exception as e:
@@ -166,6 +191,37 @@ class MenuCycleService:
                 detail=f"Error retrieving menu cycles: {str(e)}"
             )
 
+    @staticmethod
+    async def stream_menu_cycles(
+        skip: int = 0,
+        limit: int = 100,
+        status_filter: Optional[str] = None,
+        search: Optional[str] = None,
+        after_id: Optional[PydanticObjectId] = None
+    ) -> AsyncIterator[MenuCycleResponse]:
+        """
+        Iterate menu cycles straight from the database cursor, ordered by ID
+        
+        Args:
+            skip: Number of records to skip (ignored when after_id is given)
+            limit: Maximum number of records to return
+            status_filter: Filter by status
+            search: Search term for name
+            after_id: Keyset cursor; only menu cycles with a greater ID are returned
+            
+        Yields:
+            MenuCycleResponse: One menu cycle at a time
+        """
+        query = MenuCycleService._build_list_query(status_filter, search, after_id)
+        menu_cycles = MenuCycle.find(
+            query,
+            skip=0 if after_id else skip,
+            limit=limit,
+            batch_size=500
+        ).sort("_id")
+        async for menu_cycle in menu_cycles:
+            yield MenuCycleService._to_response(menu_cycle)
+
     @staticmethod
     async def update_menu_cycle(
         menu_cycle_id: str,
@@ -201,8 +257,14 @@ class MenuCycleService:
                         detail=f"Menu cycle with name '{menu_cycle_data.name}' already exists"
                     )
 
+            update_data = menu_cycle_data.model_dump(exclude_unset=True)
+
+            # Daily menus identical to the stored ones need neither checking nor rewriting
+            if menu_cycle_data.daily_menus is not None and menu_cycle_data.daily_menus == menu_cycle.daily_menus:
+                update_data.pop("daily_menus")
+
             # If updating daily menus, validate that all days have at least one dish
-            if menu_cycle_data.daily_menus:
+            elif menu_cycle_data.daily_menus:
                 for daily_menu in menu_cycle_data.daily_menus:
                     if not daily_menu.breakfast_dish_ids and not daily_menu.lunch_dish_ids and not daily_menu.snack_dish_ids:
                         raise HTTPException(
@@ -210,15 +272,12 @@ class MenuCycleService:
                             detail=f"Day {daily_menu.day} must have at least one dish assigned"
                         )
 
-            update_data = menu_cycle_data.model_dump(exclude_unset=True)
-            await menu_cycle.update({"$set": update_data})
+            # Apply the changed fields and the new timestamp in a single $set
             menu_cycle.update_timestamp()
-            await menu_cycle.save()
+            update_data["updated_at"] = menu_cycle.updated_at
+            await menu_cycle.update({"$set": update_data})
             
-            return MenuCycleResponse(
-                id=str(menu_cycle.id),
-                **menu_cycle.model_dump(exclude={"id"})
-            )
+            return MenuCycleService._to_response(menu_cycle)
             
         except ValueError:
             raise HTTPException(
@@ -272,10 +331,7 @@ class MenuCycleService:
             menu_cycle.update_timestamp()
             await menu_cycle.save()
             
-            return MenuCycleResponse(
-                id=str(menu_cycle.id),
-                **menu_cycle.model_dump(exclude={"id"})
-            )
+            return MenuCycleService._to_response(menu_cycle)
             
         except ValueError:
             raise HTTPException(
@@ -1,5 +1,6 @@
-from typing import List, Optional
-from datetime import date, timedelta
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+from datetime import date, datetime, timedelta
 from beanie import PydanticObjectId
 from fastapi import HTTPException, status
 
@@ -8,7 +9,9 @@ from models.menu_schedule import (
     MenuScheduleCreate,
     MenuScheduleUpdate,
     MenuScheduleResponse,
+    MenuScheduleListItem,
     MenuScheduleStatus,
+    CancellationInfo,
     MenuScheduleAssignmentRequest,
     MenuScheduleAssignmentSummary,
     Coverage,
@@ -19,13 +22,37 @@ from models.menu_schedule import (
 )
 from models.menu_cycle import MenuCycle, MenuCycleStatus
 from services.coverage_service import coverage_service, CoverageService
+from core.config import settings
+from utils.cache import TTLCache
 
 class MenuScheduleService:
     """Service class for menu schedule management operations"""
 
+    # Serialized citizen menus and their ETags keyed by location and date,
+    # filled by the citizen menu endpoint; see clear_citizen_menu_cache
+    citizen_menu_cache = TTLCache(ttl=settings.CITIZEN_MENU_CACHE_TTL_SECONDS, maxsize=4096)
+
+    @staticmethod
+    def clear_citizen_menu_cache() -> None:
+        """Drop cached citizen menus, e.g. after the schedules, menu cycles or dishes they show change"""
+        MenuScheduleService.citizen_menu_cache.clear()
+
     def __init__(self, coverage_svc: CoverageService = coverage_service):
         self.coverage_service = coverage_svc
 
+    @staticmethod
+    def _to_response(schedule: MenuSchedule) -> MenuScheduleResponse:
+        """
+        Build a response from a stored menu schedule without re-validating it
+
+        Args:
+            schedule: A menu schedule document loaded from or written to the database
+
+        Returns:
+            MenuScheduleResponse: The menu schedule response
+        """
+        return MenuScheduleResponse.model_construct(**dict(schedule))
+
     async def assign_menu_cycle(self, assignment_request: MenuScheduleAssignmentRequest) -> MenuScheduleAssignmentSummary:
         """
         Assign a menu cycle to locations for a specific date range
@@ -40,25 +67,30 @@ class MenuScheduleService:
             HTTPException: If validation fails or assignment cannot be created
         """
         
+        # 1-4. The menu cycle, location and overlap checks are independent
+        # lookups, so they run concurrently; failures are still reported in
+        # the order the checks are listed
+        (
+            menu_cycle,
+            validated_campuses,
+            validated_towns,
+            overlap_check,
+        ) = await asyncio.gather(
+            self._get_active_menu_cycle(assignment_request.menu_cycle_id),
+            self.coverage_service.validate_campus_ids(assignment_request.campus_ids),
+            self.coverage_service.validate_town_ids(assignment_request.town_ids),
+            self._check_overlapping_schedules(
+                assignment_request.campus_ids,
+                assignment_request.town_ids,
+                assignment_request.start_date,
+                assignment_request.end_date
+            ),
+            return_exceptions=True
+        )
+
         # 1. Validate menu cycle exists and is active
-        try:
-            menu_cycle = await MenuCycle.get(PydanticObjectId(assignment_request.menu_cycle_id))
-            if not menu_cycle:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Menu cycle with id '{assignment_request.menu_cycle_id}' not found"
-                )
-            
-            if menu_cycle.status != MenuCycleStatus.ACTIVE:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Cannot assign inactive menu cycle"
-                )
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid menu cycle ID format"
-            )
+        if isinstance(menu_cycle, BaseException):
+            raise menu_cycle
 
         # 2. Validate that at least one location is provided
         if not assignment_request.campus_ids and not assignment_request.town_ids:
@@ -67,23 +99,10 @@ class MenuScheduleService:
                 detail="At least one campus or town must be selected"
             )
 
-        # 3. Validate locations exist
-        validated_campuses = []
-        validated_towns = []
-        
-        if assignment_request.campus_ids:
-            validated_campuses = await self.coverage_service.validate_campus_ids(assignment_request.campus_ids)
-        
-        if assignment_request.town_ids:
-            validated_towns = await self.coverage_service.validate_town_ids(assignment_request.town_ids)
-
-        # 4. Check for overlapping schedules
-        await self._check_overlapping_schedules(
-            assignment_request.campus_ids,
-            assignment_request.town_ids,
-            assignment_request.start_date,
-            assignment_request.end_date
-        )
+        # 3. Validate locations exist and 4. check for overlapping schedules
+        for outcome in (validated_campuses, validated_towns, overlap_check):
+            if isinstance(outcome, BaseException):
+                raise outcome
 
         # 5. Create coverage list
         coverage = []
@@ -138,6 +157,29 @@ class MenuScheduleService:
             schedule_id=str(schedule.id)
         )
 
+    async def _get_active_menu_cycle(self, menu_cycle_id: str) -> MenuCycle:
+        """Get a menu cycle that can be assigned, i.e. that exists and is active"""
+        try:
+            menu_cycle = await MenuCycle.get(PydanticObjectId(menu_cycle_id))
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid menu cycle ID format"
+            )
+
+        if not menu_cycle:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Menu cycle with id '{menu_cycle_id}' not found"
+            )
+
+        if menu_cycle.status != MenuCycleStatus.ACTIVE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot assign inactive menu cycle"
+            )
+        return menu_cycle
+
     async def _check_overlapping_schedules(
         self,
         campus_ids: List[str],
@@ -179,10 +221,8 @@ class MenuScheduleService:
                        f"There are already active or future schedules for these locations in the requested date range."
             )
 
-    async def get_all_schedules(
+    def _build_list_query(
         self,
-        skip: int = 0,
-        limit: int = 100,
         status_filter: Optional[MenuScheduleStatus] = None,
         menu_cycle_id: Optional[str] = None,
         location_id: Optional[str] = None,
@@ -190,9 +230,10 @@ class MenuScheduleService:
         start_date_from: Optional[date] = None,
         start_date_to: Optional[date] = None,
         end_date_from: Optional[date] = None,
-        end_date_to: Optional[date] = None
-    ) -> List[MenuScheduleResponse]:
-        """Get all menu schedules with enhanced filtering for administrators"""
+        end_date_to: Optional[date] = None,
+        after_id: Optional[PydanticObjectId] = None
+    ) -> dict:
+        """Build the MongoDB filter used to list menu schedules"""
         
         query = {}
         
@@ -235,19 +276,79 @@ class MenuScheduleService:
         if date_conditions:
             query["$and"] = date_conditions
 
-        schedules = await MenuSchedule.find(
+        if after_id:
+            # Seek on the _id index instead of walking `skip` entries
+            query["_id"] = {"$lt": after_id}
+
+        return query
+
+    def stream_schedules(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status_filter: Optional[MenuScheduleStatus] = None,
+        menu_cycle_id: Optional[str] = None,
+        location_id: Optional[str] = None,
+        location_type: Optional[str] = None,
+        start_date_from: Optional[date] = None,
+        start_date_to: Optional[date] = None,
+        end_date_from: Optional[date] = None,
+        end_date_to: Optional[date] = None,
+        after_id: Optional[PydanticObjectId] = None,
+        compact: bool = False
+    ) -> AsyncIterator[Union[MenuScheduleResponse, MenuScheduleListItem]]:
+        """
+        Iterate menu schedules straight from the database cursor, newest first
+        
+        The listing follows the descending _id order, which is creation order,
+        so ``after_id`` (the last schedule of the previous page) seeks on the
+        _id index instead of walking ``skip`` entries; ``skip`` is ignored then.
+        The filters are checked before this returns, so an invalid one is
+        reported before anything is streamed.
+        
+        With ``compact`` the query projects only the MenuScheduleListItem
+        fields, so coverage and cancellation details never leave the database.
+        """
+        query = self._build_list_query(
+            status_filter, menu_cycle_id, location_id, location_type,
+            start_date_from, start_date_to, end_date_from, end_date_to, after_id
+        )
+        schedules = MenuSchedule.find(
             query,
-            skip=skip,
-            limit=limit
-        ).sort("-created_at").to_list()
+            skip=0 if after_id else skip,
+            limit=limit,
+            batch_size=500
+        ).sort("-_id")
+        if compact:
+            return schedules.project(MenuScheduleListItem)
+        return self._schedule_responses(schedules)
+
+    @staticmethod
+    async def _schedule_responses(schedules) -> AsyncIterator[MenuScheduleResponse]:
+        """Convert schedules from a database cursor into responses as they arrive"""
+        async for schedule in schedules:
+            yield MenuScheduleService._to_response(schedule)
 
-        return [
-            MenuScheduleResponse(
-                id=str(schedule.id),
-                **schedule.model_dump(exclude={"id"})
-            )
-            for schedule in schedules
-        ]
+    async def get_all_schedules(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status_filter: Optional[MenuScheduleStatus] = None,
+        menu_cycle_id: Optional[str] = None,
+        location_id: Optional[str] = None,
+        location_type: Optional[str] = None,
+        start_date_from: Optional[date] = None,
+        start_date_to: Optional[date] = None,
+        end_date_from: Optional[date] = None,
+        end_date_to: Optional[date] = None,
+        after_id: Optional[PydanticObjectId] = None
+    ) -> List[MenuScheduleResponse]:
+        """Get all menu schedules with enhanced filtering for administrators, newest first"""
+        schedules = self.stream_schedules(
+            skip, limit, status_filter, menu_cycle_id, location_id, location_type,
+            start_date_from, start_date_to, end_date_from, end_date_to, after_id
+        )
+        return [schedule async for schedule in schedules]
 
     async def get_schedule_by_id(self, schedule_id: str) -> MenuScheduleResponse:
         """Get a specific menu schedule by ID"""
@@ -260,16 +361,67 @@ class MenuScheduleService:
                     detail=f"Menu schedule with id '{schedule_id}' not found"
                 )
             
-            return MenuScheduleResponse(
-                id=str(schedule.id),
-                **schedule.model_dump(exclude={"id"})
-            )
+            return self._to_response(schedule)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid schedule ID format"
             )
 
+    async def get_schedule_version(self, schedule_id: str) -> Optional[datetime]:
+        """
+        Get a schedule's last update time with a projected query, for ETags
+
+        Returns:
+            Optional[datetime]: The schedule's updated_at, or None if it does not exist
+        """
+        schedule = await MenuSchedule.get_motor_collection().find_one(
+            {"_id": PydanticObjectId(schedule_id)}, {"updated_at": 1}
+        )
+        return schedule["updated_at"] if schedule else None
+
+    async def get_schedule_detailed_version(self, schedule_id: str) -> Optional[Tuple]:
+        """
+        Get the versions the detailed view of a schedule is built from, for ETags
+
+        Reads only the update times of the schedule, its menu cycle and the
+        cycle's dishes (plus the cycle's dish IDs), without building the view.
+
+        Returns:
+            Optional[Tuple]: (schedule updated_at, cycle updated_at, sorted
+                (dish ID, dish updated_at) pairs), or None if the schedule or
+                its cycle does not exist
+        """
+        from models.dish import Dish
+        
+        schedule = await MenuSchedule.get_motor_collection().find_one(
+            {"_id": PydanticObjectId(schedule_id)}, {"updated_at": 1, "menu_cycle_id": 1}
+        )
+        if not schedule:
+            return None
+        menu_cycle = await MenuCycle.get_motor_collection().find_one(
+            {"_id": schedule["menu_cycle_id"]}, {"updated_at": 1, "daily_menus": 1}
+        )
+        if not menu_cycle:
+            return None
+        
+        dish_ids = list({
+            dish_id
+            for dm in menu_cycle.get("daily_menus", [])
+            for meal in ("breakfast_dish_ids", "lunch_dish_ids", "snack_dish_ids")
+            for dish_id in dm.get(meal, [])
+        })
+        dish_versions = sorted(
+            [
+                (str(dish["_id"]), dish.get("updated_at"))
+                async for dish in Dish.get_motor_collection().find(
+                    {"_id": {"$in": dish_ids}}, {"updated_at": 1}
+                )
+            ],
+            key=lambda version: version[0]
+        )
+        return schedule["updated_at"], menu_cycle["updated_at"], tuple(dish_versions)
+
     async def get_schedule_detailed_view(self, schedule_id: str) -> "ScheduleDetailedResponse":
         """Get detailed schedule view with daily effective menus for administrators"""
         from models.menu_schedule import ScheduleDetailedResponse, DailyMenuByLocation
@@ -300,6 +452,23 @@ class MenuScheduleService:
                 schedule_dates.append(current_date)
                 current_date += timedelta(days=1)
             
+            # Index the cycle days and load every dish of the cycle in one query
+            cycle_days = {dm.day: dm for dm in menu_cycle.daily_menus}
+            dishes_by_id = await self._get_dishes_by_id([
+                dish_id
+                for dm in menu_cycle.daily_menus
+                for dish_id in dm.breakfast_dish_ids + dm.lunch_dish_ids + dm.snack_dish_ids
+            ])
+            
+            # Resolve the meals of each cycle day once, shared by all locations
+            meals_by_day = {}
+            for day, dm in cycle_days.items():
+                meals_by_day[day] = (
+                    self._pick_dishes(dishes_by_id, dm.breakfast_dish_ids),
+                    self._pick_dishes(dishes_by_id, dm.lunch_dish_ids),
+                    self._pick_dishes(dishes_by_id, dm.snack_dish_ids),
+                )
+            
             # Generate daily menus for each location and date
             daily_menus = []
             
@@ -309,37 +478,23 @@ class MenuScheduleService:
                     days_since_start = (schedule_date - schedule.start_date).days
                     cycle_day = (days_since_start % menu_cycle.duration_days) + 1
                     
-                    # Find the daily menu for this day
-                    daily_menu_data = None
-                    for dm in menu_cycle.daily_menus:
-                        if dm.day == cycle_day:
-                            daily_menu_data = dm
-                            break
+                    breakfast_dishes, lunch_dishes, snack_dishes = meals_by_day.get(cycle_day, ([], [], []))
                     
-                    # Get dish details for each meal type
-                    breakfast_dishes = []
-                    lunch_dishes = []
-                    snack_dishes = []
-                    
-                    if daily_menu_data:
-                        breakfast_dishes = await self._get_dish_details_simple(daily_menu_data.breakfast_dish_ids)
-                        lunch_dishes = await self._get_dish_details_simple(daily_menu_data.lunch_dish_ids)
-                        snack_dishes = await self._get_dish_details_simple(daily_menu_data.snack_dish_ids)
-                    
-                    daily_menu = DailyMenuByLocation(
-                        date=schedule_date,
+                    daily_menu = DailyMenuByLocation.model_construct(
                         location_id=coverage.location_id,
                         location_name=coverage.location_name,
                         location_type=coverage.location_type,
+                        menu_date=schedule_date,
                         cycle_day=cycle_day,
-                        breakfast_dishes=breakfast_dishes,
-                        lunch_dishes=lunch_dishes,
-                        snack_dishes=snack_dishes
+                        breakfast=breakfast_dishes,
+                        lunch=lunch_dishes,
+                        snack=snack_dishes
                     )
                     
                     daily_menus.append(daily_menu)
             
-            return ScheduleDetailedResponse(
+            # Everything here comes from validated documents, so skip re-validation
+            return ScheduleDetailedResponse.model_construct(
                 id=str(schedule.id),
                 menu_cycle_id=str(schedule.menu_cycle_id),
                 menu_cycle_name=menu_cycle.name,
@@ -347,9 +502,12 @@ class MenuScheduleService:
                 start_date=schedule.start_date,
                 end_date=schedule.end_date,
                 status=schedule.status,
-                daily_menus=daily_menus,
+                cancellation_info=schedule.cancellation_info,
                 created_at=schedule.created_at,
-                updated_at=schedule.updated_at
+                updated_at=schedule.updated_at,
+                daily_menus=daily_menus,
+                total_days=len(schedule_dates),
+                total_locations=len(schedule.coverage)
             )
             
         except ValueError:
@@ -444,16 +602,19 @@ class MenuScheduleService:
                     exclude_schedule_id=schedule_id
                 )
 
-            # 5. Update the schedule
+            # 5. Update the schedule. Cancelling through this endpoint records
+            # the cancellation like /cancel does, so coverage or dates can be
+            # changed and the schedule cancelled in a single request
             update_data = schedule_data.model_dump(exclude_unset=True)
-            await schedule.update({"$set": update_data})
+            if schedule_data.status == MenuScheduleStatus.CANCELLED and schedule_data.cancellation_info is None:
+                update_data["cancellation_info"] = CancellationInfo().model_dump()
+
+            # Apply the changed fields and the new timestamp in a single $set
             schedule.update_timestamp()
-            await schedule.save()
+            update_data["updated_at"] = schedule.updated_at
+            await schedule.update({"$set": update_data})
             
-            return MenuScheduleResponse(
-                id=str(schedule.id),
-                **schedule.model_dump(exclude={"id"})
-            )
+            return self._to_response(schedule)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -483,16 +644,12 @@ class MenuScheduleService:
                     detail="Cannot cancel completed schedule"
                 )
 
-            from models.menu_schedule import CancellationInfo
             schedule.status = MenuScheduleStatus.CANCELLED
             schedule.cancellation_info = CancellationInfo(reason=reason)
             schedule.update_timestamp()
             await schedule.save()
             
-            return MenuScheduleResponse(
-                id=str(schedule.id),
-                **schedule.model_dump(exclude={"id"})
-            )
+            return self._to_response(schedule)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -554,10 +711,7 @@ class MenuScheduleService:
             schedule.update_timestamp()
             await schedule.save()
             
-            return MenuScheduleResponse(
-                id=str(schedule.id),
-                **schedule.model_dump(exclude={"id"})
-            )
+            return self._to_response(schedule)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -623,7 +777,6 @@ class MenuScheduleService:
             CitizenMenuResponse: The effective menu for the date and location
         """
         from models.menu_cycle import MenuCycle
-        from models.dish import Dish
         
         try:
             # 1. Find active menu schedule for this location and date
@@ -713,12 +866,15 @@ class MenuScheduleService:
                     message=f"No menu configured for day {cycle_day} of the cycle."
                 )
             
-            # 5. Get dish details for each meal type
-            breakfast_dishes = await self._get_dish_details(daily_menu.breakfast_dish_ids)
-            lunch_dishes = await self._get_dish_details(daily_menu.lunch_dish_ids)
-            snack_dishes = await self._get_dish_details(daily_menu.snack_dish_ids)
+            # 5. Get dish details for all meal types in a single query
+            dishes_by_id = await self._get_dishes_by_id(
+                daily_menu.breakfast_dish_ids + daily_menu.lunch_dish_ids + daily_menu.snack_dish_ids
+            )
+            breakfast_dishes = self._pick_dishes(dishes_by_id, daily_menu.breakfast_dish_ids)
+            lunch_dishes = self._pick_dishes(dishes_by_id, daily_menu.lunch_dish_ids)
+            snack_dishes = self._pick_dishes(dishes_by_id, daily_menu.snack_dish_ids)
             
-            return CitizenMenuResponse(
+            return CitizenMenuResponse.model_construct(
                 location_id=location_id,
                 location_name=location_name,
                 location_type=location_type,
@@ -737,16 +893,17 @@ class MenuScheduleService:
                 detail=f"Error retrieving menu: {str(e)}"
             )
     
-    async def _get_dish_details(self, dish_ids: List[PydanticObjectId]) -> List["DishInMenu"]:
-        """Helper method to get dish details and convert to DishInMenu format"""
+    async def _get_dishes_by_id(self, dish_ids: List[PydanticObjectId]) -> Dict[PydanticObjectId, DishInMenu]:
+        """Fetch the given dishes in one query and map them by id in DishInMenu format"""
         from models.dish import Dish
         
-        if not dish_ids:
-            return []
+        unique_ids = list(dict.fromkeys(dish_ids))
+        if not unique_ids:
+            return {}
         
-        dishes = await Dish.find({"_id": {"$in": dish_ids}}).to_list()
+        dishes = await Dish.find({"_id": {"$in": unique_ids}}).to_list()
         
-        dish_in_menu_list = []
+        dishes_by_id = {}
         for dish in dishes:
             nutritional_info = None
             if dish.nutritional_info:
@@ -756,14 +913,21 @@ class MenuScheduleService:
                     "photo_url": dish.nutritional_info.photo_url
                 }
             
-            dish_in_menu_list.append(DishInMenu(
+            dishes_by_id[dish.id] = DishInMenu.model_construct(
                 id=str(dish.id),
                 name=dish.name,
                 description=dish.description,
                 nutritional_info=nutritional_info
-            ))
+            )
         
-        return dish_in_menu_list
+        return dishes_by_id
+
+    @staticmethod
+    def _pick_dishes(
+        dishes_by_id: Dict[PydanticObjectId, DishInMenu], dish_ids: List[PydanticObjectId]
+    ) -> List[DishInMenu]:
+        """Return the fetched dishes for ``dish_ids`` in menu order, skipping missing ones"""
+        return [dishes_by_id[dish_id] for dish_id in dish_ids if dish_id in dishes_by_id]
 
 # Create singleton instance
 menu_schedule_service = MenuScheduleService() 
\ No newline at end of file
@@ -1,10 +1,14 @@
+import asyncio
+import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import List, Dict, Optional
 from datetime import date as Date, timedelta
 from beanie import PydanticObjectId
 from fastapi import HTTPException, status
 
 from models.nutritional_analysis import (
-    FoodGroup, FoodGroupPortion, NutrientSummary, DailyNutritionalAnalysis,
+    NUTRIENT_KEYS, FoodGroup, FoodGroupPortion, NutrientSummary, DailyNutritionalAnalysis,
     NutritionalAnalysisReport, SimplifiedNutritionalSummary,
     NutritionalRequirements, NutritionalComparisonReport
 )
@@ -12,6 +16,8 @@ from models.menu_schedule import MenuSchedule, MenuScheduleStatus
 from models.menu_cycle import MenuCycle
 from models.dish import Dish, DishType
 from models.ingredient import Ingredient
+from core.config import settings
+from utils.cache import TTLCache
 
 
 class NutritionalAnalysisService:
@@ -39,12 +45,148 @@ class NutritionalAnalysisService:
         "aceites": FoodGroup.PROTEIN,  # Fats grouped with protein
         "condimentos": FoodGroup.VEGETABLES,  # Herbs and spices
     }
+
+    # Food groups in a fixed order, so per-group totals can live in plain lists
+    FOOD_GROUPS = tuple(FoodGroup)
+    FOOD_GROUP_INDEX = {food_group: index for index, food_group in enumerate(FOOD_GROUPS)}
+    
+    # NutritionalInfo fields totalled into each of NUTRIENT_KEYS, in the same order
+    NUTRITIONAL_INFO_FIELDS = (
+        "calories",
+        "protein",
+        "carbohydrates",
+        "fat",
+        "fiber",
+        "calcium",
+        "iron",
+        "vitamin_c",
+        "vitamin_a",
+    )
+    
+    # (distribution key, NutrientSummary field, kcal per gram) for each macronutrient
+    MACRONUTRIENT_ENERGY = (
+        ("protein_percentage", "total_protein", 4),
+        ("carbohydrate_percentage", "total_carbohydrates", 4),
+        ("fat_percentage", "total_fat", 9),
+    )
+    
+    # Daily nutritional requirements by age group, built once and shared by
+    # every comparison report
+    NUTRITIONAL_REQUIREMENTS = {
+        "school_age_6_12": NutritionalRequirements(
+            age_group="school_age_6_12",
+            daily_calories=1800.0,
+            daily_protein=45.0,
+            daily_calcium=1000.0,
+            daily_iron=10.0,
+            daily_vitamin_c=45.0,
+            daily_vitamin_a=700.0
+        ),
+        "school_age_13_18": NutritionalRequirements(
+            age_group="school_age_13_18",
+            daily_calories=2200.0,
+            daily_protein=55.0,
+            daily_calcium=1200.0,
+            daily_iron=12.0,
+            daily_vitamin_c=75.0,
+            daily_vitamin_a=900.0
+        ),
+    }
+    
+    # (actual intake field, requirement field, improvement area) for each
+    # nutrient compared against requirements, in report order
+    COMPLIANCE_NUTRIENTS = (
+        ("total_calories", "daily_calories", "Energy/Calories"),
+        ("total_protein", "daily_protein", "Protein"),
+        ("total_calcium", "daily_calcium", "Calcium"),
+        ("total_iron", "daily_iron", "Iron"),
+        ("total_vitamin_c", "daily_vitamin_c", "Vitamin C"),
+        ("total_vitamin_a", "daily_vitamin_a", "Vitamin A"),
+    )
+    
+    # Overall compliance thresholds and the status for each band between them:
+    # below 70 is poor, 70 up to 80 fair, 80 up to 90 good, 90 and above excellent
+    COMPLIANCE_THRESHOLDS = (70, 80, 90)
+    COMPLIANCE_STATUSES = ("poor", "fair", "good", "excellent")
+    
+    # Reports keyed by schedule and cycle versions, see generate_nutritional_report
+    _report_cache = TTLCache(ttl=settings.REPORT_CACHE_TTL_SECONDS)
+    # Last report of each schedule by ID alone, so the views a dashboard loads
+    # together skip re-reading the schedule and cycle; dropped on writes
+    _recent_reports = TTLCache(ttl=settings.RECENT_REPORT_TTL_SECONDS)
+    # Schedules in these states are no longer edited, so their reports are kept longer
+    FINISHED_SCHEDULE_STATUSES = frozenset({MenuScheduleStatus.COMPLETED, MenuScheduleStatus.CANCELLED})
+    # Keywords marking a recommendation as relevant to the food group view,
+    # the nutrient view or both; see _recommendation_views
+    RECOMMENDATION_KEYWORD_VIEWS = {
+        "group": frozenset({"food_groups"}),
+        "fruit": frozenset({"food_groups"}),
+        "vegetable": frozenset({"food_groups"}),
+        "dairy": frozenset({"food_groups"}),
+        "grain": frozenset({"food_groups"}),
+        "protein": frozenset({"food_groups", "nutrients"}),
+        "calorie": frozenset({"nutrients"}),
+        "vitamin": frozenset({"nutrients"}),
+        "mineral": frozenset({"nutrients"}),
+        "iron": frozenset({"nutrients"}),
+        "calcium": frozenset({"nutrients"}),
+    }
+    RECOMMENDATION_KEYWORD_PATTERN = re.compile("|".join(RECOMMENDATION_KEYWORD_VIEWS), re.IGNORECASE)
+    # Report builds in flight, keyed by schedule ID and shared by concurrent callers
+    _report_builds: Dict[str, "asyncio.Future[NutritionalAnalysisReport]"] = {}
+    # Reports being computed at once; further builds wait for a free slot
+    _report_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_REPORT_BUILDS)
+    # Bumped by clear_report_cache (all schedules) and forget_schedule_report
+    # (one schedule); a build only caches its report if neither moved meanwhile
+    _report_epoch = 0
+    _report_generations: Dict[str, int] = {}
+    
+    @staticmethod
+    def clear_report_cache() -> None:
+        """Drop cached reports, e.g. after dishes or menu cycles they were built from change"""
+        NutritionalAnalysisService._report_epoch += 1
+        NutritionalAnalysisService._report_builds.clear()
+        NutritionalAnalysisService._report_cache.clear()
+        NutritionalAnalysisService._recent_reports.clear()
+    
+    @staticmethod
+    def forget_schedule_report(schedule_id: str) -> None:
+        """Stop serving a schedule's recent report without checking its version, after the schedule changes"""
+        generations = NutritionalAnalysisService._report_generations
+        generations[schedule_id] = generations.get(schedule_id, 0) + 1
+        NutritionalAnalysisService._report_builds.pop(schedule_id, None)
+        NutritionalAnalysisService._recent_reports.pop(schedule_id)
+    
+    @staticmethod
+    def _report_generation(schedule_id: str) -> tuple:
+        """Current cache generation of a schedule's report, see _report_generations"""
+        return (
+            NutritionalAnalysisService._report_epoch,
+            NutritionalAnalysisService._report_generations.get(schedule_id, 0),
+        )
     
     @staticmethod
     async def generate_nutritional_report(schedule_id: str) -> NutritionalAnalysisReport:
         """
         Generate a complete nutritional analysis report for a menu schedule
         
+        Reports are cached per schedule and menu cycle version, so editing
+        either one yields a fresh report. Reports also depend on the dishes
+        of the cycle and, for dishes without a dish type, on their
+        ingredients' categories; dish and ingredient writes clear the cache
+        through `clear_report_cache`. The summary, comparison and food group views
+        are derived from this report and share its cache entry. Reports of
+        completed or cancelled schedules are kept for
+        FINISHED_REPORT_CACHE_TTL_SECONDS instead of REPORT_CACHE_TTL_SECONDS.
+        Concurrent requests for the same schedule, e.g. the views of one
+        dashboard, wait on a single build; writes detach that build, so
+        later callers start a new one that reads the written versions.
+        For RECENT_REPORT_TTL_SECONDS after that, the report is served by
+        schedule ID alone, without the two version reads; schedule writes
+        drop it via `forget_schedule_report`. A build that was running when the cache
+        was cleared or the schedule forgotten returns its report to its
+        callers but does not cache it.
+        
         Args:
             schedule_id: ID of the menu schedule to analyze
             
@@ -54,6 +196,47 @@ class NutritionalAnalysisService:
         Raises:
             HTTPException: If schedule not found or analysis fails
         """
+        recent_report = NutritionalAnalysisService._recent_reports.get(schedule_id)
+        if recent_report is not None:
+            return recent_report
+        
+        builds = NutritionalAnalysisService._report_builds
+        build = builds.get(schedule_id)
+        if build is None:
+            generation = NutritionalAnalysisService._report_generation(schedule_id)
+            build = asyncio.ensure_future(NutritionalAnalysisService._build_report(schedule_id, generation))
+            builds[schedule_id] = build
+            # A build detached by a write must not remove the one that replaced it
+            build.add_done_callback(
+                lambda done: builds.pop(schedule_id) if builds.get(schedule_id) is done else None
+            )
+        # A cancelled caller must not cancel the build the others are waiting on
+        return await asyncio.shield(build)
+    
+    @staticmethod
+    async def warm_report_cache(schedule_id: str) -> None:
+        """
+        Build a schedule's report ahead of the first request for it
+        
+        Meant to run as a background task after a schedule is assigned or
+        updated, so report views are served from the cache. A request that
+        arrives while the build runs waits on it instead of starting another.
+        """
+        try:
+            await NutritionalAnalysisService.generate_nutritional_report(schedule_id)
+        except HTTPException:
+            # Nothing to warm; the error is reported when the report is requested
+            pass
+    
+    @staticmethod
+    async def _build_report(schedule_id: str, generation: tuple) -> NutritionalAnalysisReport:
+        """
+        Load the schedule and its menu cycle and return their cached or newly built report
+        
+        The report is only cached while `generation` is still the schedule's
+        current one, so a build that read the schedule before a write cannot
+        bring back the pre-write report.
+        """
         try:
             # Get the menu schedule
             schedule = await MenuSchedule.get(PydanticObjectId(schedule_id))
@@ -71,49 +254,25 @@ class NutritionalAnalysisService:
                     detail=f"Menu cycle with id '{schedule.menu_cycle_id}' not found"
                 )
             
-            # Generate date range for the schedule
-            schedule_dates = []
-            current_date = schedule.start_date
-            while current_date <= schedule.end_date:
-                schedule_dates.append(current_date)
-                current_date += timedelta(days=1)
-            
-            # Analyze each day
-            daily_analyses = []
-            for schedule_date in schedule_dates:
-                days_since_start = (schedule_date - schedule.start_date).days
-                cycle_day = (days_since_start % menu_cycle.duration_days) + 1
-                
-                daily_analysis = await NutritionalAnalysisService._analyze_daily_menu(
-                    menu_cycle, cycle_day, schedule_date
-                )
-                daily_analyses.append(daily_analysis)
+            cache_key = (schedule_id, schedule.updated_at, menu_cycle.id, menu_cycle.updated_at)
+            cached_report = NutritionalAnalysisService._report_cache.get(cache_key)
+            if cached_report is not None:
+                if NutritionalAnalysisService._report_generation(schedule_id) == generation:
+                    NutritionalAnalysisService._recent_reports.set(schedule_id, cached_report)
+                return cached_report
             
-            # Calculate average nutrients and food groups
-            avg_nutrients = NutritionalAnalysisService._calculate_average_nutrients(daily_analyses)
-            avg_food_groups = NutritionalAnalysisService._calculate_average_food_groups(daily_analyses)
+            # Cap the number of reports computed at once; cache hits don't queue
+            async with NutritionalAnalysisService._report_slots:
+                report = await NutritionalAnalysisService._compute_report(schedule_id, schedule, menu_cycle)
             
-            # Calculate nutritional adequacy score
-            adequacy_score = NutritionalAnalysisService._calculate_adequacy_score(avg_nutrients, avg_food_groups)
-            
-            # Generate recommendations
-            recommendations = NutritionalAnalysisService._generate_recommendations(avg_nutrients, avg_food_groups)
-            
-            return NutritionalAnalysisReport(
-                menu_schedule_id=schedule_id,
-                menu_cycle_name=menu_cycle.name,
-                analysis_period={
-                    "start_date": schedule.start_date.isoformat(),
-                    "end_date": schedule.end_date.isoformat()
-                },
-                location_count=len(schedule.coverage),
-                total_days=len(schedule_dates),
-                daily_analysis=daily_analyses,
-                average_daily_nutrients=avg_nutrients,
-                average_daily_food_groups=avg_food_groups,
-                nutritional_adequacy_score=adequacy_score,
-                recommendations=recommendations
-            )
+            if schedule.status in NutritionalAnalysisService.FINISHED_SCHEDULE_STATUSES:
+                ttl = settings.FINISHED_REPORT_CACHE_TTL_SECONDS
+            else:
+                ttl = settings.REPORT_CACHE_TTL_SECONDS
+            if NutritionalAnalysisService._report_generation(schedule_id) == generation:
+                NutritionalAnalysisService._report_cache.set(cache_key, report, ttl=ttl)
+                NutritionalAnalysisService._recent_reports.set(schedule_id, report)
+            return report
             
         except ValueError:
             raise HTTPException(
@@ -128,6 +287,55 @@ class NutritionalAnalysisService:
                 detail=f"Error generating nutritional report: {str(e)}"
             )
     
+    @staticmethod
+    async def _compute_report(
+        schedule_id: str, schedule: MenuSchedule, menu_cycle: MenuCycle
+    ) -> NutritionalAnalysisReport:
+        """Analyze every day of a schedule and assemble its report"""
+        # Generate date range for the schedule
+        schedule_dates = []
+        current_date = schedule.start_date
+        while current_date <= schedule.end_date:
+            schedule_dates.append(current_date)
+            current_date += timedelta(days=1)
+        
+        # Analyze each day
+        daily_analyses = []
+        for schedule_date in schedule_dates:
+            days_since_start = (schedule_date - schedule.start_date).days
+            cycle_day = (days_since_start % menu_cycle.duration_days) + 1
+            
+            daily_analysis = await NutritionalAnalysisService._analyze_daily_menu(
+                menu_cycle, cycle_day, schedule_date
+            )
+            daily_analyses.append(daily_analysis)
+        
+        # Calculate average nutrients and food groups
+        avg_nutrients = NutritionalAnalysisService._calculate_average_nutrients(daily_analyses)
+        avg_food_groups = NutritionalAnalysisService._calculate_average_food_groups(daily_analyses)
+        
+        # Calculate nutritional adequacy score
+        adequacy_score = NutritionalAnalysisService._calculate_adequacy_score(avg_nutrients, avg_food_groups)
+        
+        # Generate recommendations
+        recommendations = NutritionalAnalysisService._generate_recommendations(avg_nutrients, avg_food_groups)
+        
+        return NutritionalAnalysisReport(
+            menu_schedule_id=schedule_id,
+            menu_cycle_name=menu_cycle.name,
+            analysis_period={
+                "start_date": schedule.start_date.isoformat(),
+                "end_date": schedule.end_date.isoformat()
+            },
+            location_count=len(schedule.coverage),
+            total_days=len(schedule_dates),
+            daily_analysis=daily_analyses,
+            average_daily_nutrients=avg_nutrients,
+            average_daily_food_groups=avg_food_groups,
+            nutritional_adequacy_score=adequacy_score,
+            recommendations=recommendations
+        )
+    
     @staticmethod
     async def _analyze_daily_menu(menu_cycle: MenuCycle, cycle_day: int, analysis_date: Date) -> DailyNutritionalAnalysis:
         """Analyze nutritional content for a specific day"""
@@ -184,7 +392,11 @@ class NutritionalAnalysisService:
     async def _analyze_food_groups(dishes: List[Dish]) -> List[FoodGroupPortion]:
         """Analyze food groups from a list of dishes"""
         
-        food_group_data = {}
+        food_groups = NutritionalAnalysisService.FOOD_GROUPS
+        group_count = len(food_groups)
+        total_portions = [0.0] * group_count
+        dishes_count = [0] * group_count
+        main_dishes = [[] for _ in range(group_count)]
         
         for dish in dishes:
             # Determine food group from dish type
@@ -202,30 +414,23 @@ class NutritionalAnalysisService:
             if not food_group:
                 food_group = FoodGroup.GRAINS
             
-            # Initialize food group data if not exists
-            if food_group not in food_group_data:
-                food_group_data[food_group] = {
-                    "total_portions": 0.0,
-                    "dishes_count": 0,
-                    "main_dishes": []
-                }
-            
             # Add dish to food group (assuming 1 portion per dish)
-            food_group_data[food_group]["total_portions"] += 1.0
-            food_group_data[food_group]["dishes_count"] += 1
-            food_group_data[food_group]["main_dishes"].append(dish.name)
-        
-        # Convert to FoodGroupPortion objects
-        food_group_portions = []
-        for food_group, data in food_group_data.items():
-            food_group_portions.append(FoodGroupPortion(
-                food_group=food_group,
-                total_portions=data["total_portions"],
-                dishes_count=data["dishes_count"],
-                main_dishes=data["main_dishes"]
-            ))
-        
-        return food_group_portions
+            index = NutritionalAnalysisService.FOOD_GROUP_INDEX[food_group]
+            total_portions[index] += 1.0
+            dishes_count[index] += 1
+            main_dishes[index].append(dish.name)
+        
+        # Convert to FoodGroupPortion objects for the groups that are present
+        return [
+            FoodGroupPortion(
+                food_group=food_groups[index],
+                total_portions=total_portions[index],
+                dishes_count=dishes_count[index],
+                main_dishes=main_dishes[index]
+            )
+            for index in range(group_count)
+            if dishes_count[index]
+        ]
     
     @staticmethod
     async def _determine_food_group_from_ingredients(ingredients) -> Optional[FoodGroup]:
@@ -257,22 +462,18 @@ class NutritionalAnalysisService:
     def _calculate_daily_nutrients(dishes: List[Dish]) -> NutrientSummary:
         """Calculate total nutrients for a list of dishes"""
         
-        total_nutrients = NutrientSummary()
+        fields = NutritionalAnalysisService.NUTRITIONAL_INFO_FIELDS
+        rows = [
+            [getattr(dish.nutritional_info, field) or 0.0 for field in fields]
+            for dish in dishes
+            if dish.nutritional_info
+        ]
+        if not rows:
+            return NutrientSummary()
         
-        for dish in dishes:
-            if dish.nutritional_info:
-                ni = dish.nutritional_info
-                total_nutrients.total_calories += ni.calories or 0.0
-                total_nutrients.total_protein += ni.protein or 0.0
-                total_nutrients.total_carbohydrates += ni.carbohydrates or 0.0
-                total_nutrients.total_fat += ni.fat or 0.0
-                total_nutrients.total_fiber += ni.fiber or 0.0
-                total_nutrients.total_calcium += ni.calcium or 0.0
-                total_nutrients.total_iron += ni.iron or 0.0
-                total_nutrients.total_vitamin_c += ni.vitamin_c or 0.0
-                total_nutrients.total_vitamin_a += ni.vitamin_a or 0.0
-        
-        return total_nutrients
+        # Sum each nutrient column once and build the summary in a single pass
+        totals = [sum(column, 0.0) for column in zip(*rows)]
+        return NutrientSummary(**dict(zip(NUTRIENT_KEYS, totals)))
     
     @staticmethod
     def _calculate_average_nutrients(daily_analyses: List[DailyNutritionalAnalysis]) -> NutrientSummary:
@@ -281,33 +482,15 @@ class NutritionalAnalysisService:
         if not daily_analyses:
             return NutrientSummary()
         
-        total_nutrients = NutrientSummary()
-        
-        for analysis in daily_analyses:
-            nutrients = analysis.nutrients
-            total_nutrients.total_calories += nutrients.total_calories
-            total_nutrients.total_protein += nutrients.total_protein
-            total_nutrients.total_carbohydrates += nutrients.total_carbohydrates
-            total_nutrients.total_fat += nutrients.total_fat
-            total_nutrients.total_fiber += nutrients.total_fiber
-            total_nutrients.total_calcium += nutrients.total_calcium
-            total_nutrients.total_iron += nutrients.total_iron
-            total_nutrients.total_vitamin_c += nutrients.total_vitamin_c
-            total_nutrients.total_vitamin_a += nutrients.total_vitamin_a
+        rows = [
+            [getattr(analysis.nutrients, key) for key in NUTRIENT_KEYS]
+            for analysis in daily_analyses
+        ]
         
         # Calculate averages
         days_count = len(daily_analyses)
-        return NutrientSummary(
-            total_calories=total_nutrients.total_calories / days_count,
-            total_protein=total_nutrients.total_protein / days_count,
-            total_carbohydrates=total_nutrients.total_carbohydrates / days_count,
-            total_fat=total_nutrients.total_fat / days_count,
-            total_fiber=total_nutrients.total_fiber / days_count,
-            total_calcium=total_nutrients.total_calcium / days_count,
-            total_iron=total_nutrients.total_iron / days_count,
-            total_vitamin_c=total_nutrients.total_vitamin_c / days_count,
-            total_vitamin_a=total_nutrients.total_vitamin_a / days_count
-        )
+        averages = [sum(column, 0.0) / days_count for column in zip(*rows)]
+        return NutrientSummary(**dict(zip(NUTRIENT_KEYS, averages)))
     
     @staticmethod
     def _calculate_average_food_groups(daily_analyses: List[DailyNutritionalAnalysis]) -> List[FoodGroupPortion]:
@@ -316,36 +499,31 @@ class NutritionalAnalysisService:
         if not daily_analyses:
             return []
         
-        food_group_totals = {}
+        food_groups = NutritionalAnalysisService.FOOD_GROUPS
+        group_count = len(food_groups)
+        total_portions = [0.0] * group_count
+        dishes_count = [0] * group_count
+        main_dishes = [set() for _ in range(group_count)]
         
         for analysis in daily_analyses:
             for food_group_portion in analysis.food_groups:
-                food_group = food_group_portion.food_group
-                
-                if food_group not in food_group_totals:
-                    food_group_totals[food_group] = {
-                        "total_portions": 0.0,
-                        "dishes_count": 0,
-                        "main_dishes": set()
-                    }
-                
-                food_group_totals[food_group]["total_portions"] += food_group_portion.total_portions
-                food_group_totals[food_group]["dishes_count"] += food_group_portion.dishes_count
-                food_group_totals[food_group]["main_dishes"].update(food_group_portion.main_dishes)
+                index = NutritionalAnalysisService.FOOD_GROUP_INDEX[food_group_portion.food_group]
+                total_portions[index] += food_group_portion.total_portions
+                dishes_count[index] += food_group_portion.dishes_count
+                main_dishes[index].update(food_group_portion.main_dishes)
         
         # Calculate averages
         days_count = len(daily_analyses)
-        average_food_groups = []
-        
-        for food_group, data in food_group_totals.items():
-            average_food_groups.append(FoodGroupPortion(
-                food_group=food_group,
-                total_portions=data["total_portions"] / days_count,
-                dishes_count=int(data["dishes_count"] / days_count),
-                main_dishes=list(data["main_dishes"])[:5]  # Top 5 dishes
-            ))
-        
-        return average_food_groups
+        return [
+            FoodGroupPortion(
+                food_group=food_groups[index],
+                total_portions=total_portions[index] / days_count,
+                dishes_count=int(dishes_count[index] / days_count),
+                main_dishes=list(main_dishes[index])[:5]  # Top 5 dishes
+            )
+            for index in range(group_count)
+            if dishes_count[index]
+        ]
     
     @staticmethod
     def _calculate_adequacy_score(nutrients: NutrientSummary, food_groups: List[FoodGroupPortion]) -> float:
@@ -453,75 +631,132 @@ class NutritionalAnalysisService:
         )
     
     @staticmethod
-    async def compare_with_requirements(schedule_id: str, age_group: str = "school_age_6_12") -> NutritionalComparisonReport:
-        """Compare menu nutrition with standard requirements"""
+    @lru_cache(maxsize=1024)
+    def _recommendation_views(recommendation: str) -> frozenset:
+        """
+        Return the views ("food_groups", "nutrients") a recommendation belongs to
         
-        # Define nutritional requirements for different age groups
-        requirements_data = {
-            "school_age_6_12": NutritionalRequirements(
-                age_group="school_age_6_12",
-                daily_calories=1800.0,
-                daily_protein=45.0,
-                daily_calcium=1000.0,
-                daily_iron=10.0,
-                daily_vitamin_c=45.0,
-                daily_vitamin_a=700.0
-            ),
-            "school_age_13_18": NutritionalRequirements(
-                age_group="school_age_13_18",
-                daily_calories=2200.0,
-                daily_protein=55.0,
-                daily_calcium=1200.0,
-                daily_iron=12.0,
-                daily_vitamin_c=75.0,
-                daily_vitamin_a=900.0
-            )
+        Each recommendation is scanned once for all keywords. Recommendations
+        come from a small set of templates, so the result is cached per text
+        and shared by both views.
+        """
+        views = frozenset()
+        for keyword in NutritionalAnalysisService.RECOMMENDATION_KEYWORD_PATTERN.findall(recommendation):
+            views |= NutritionalAnalysisService.RECOMMENDATION_KEYWORD_VIEWS[keyword.lower()]
+        return views
+    
+    @staticmethod
+    async def get_food_group_analysis(schedule_id: str) -> dict:
+        """Get the food group part of the nutritional report"""
+        
+        full_report = await NutritionalAnalysisService.generate_nutritional_report(schedule_id)
+        
+        # Extract food group information
+        food_group_analysis = {
+            "menu_schedule_id": schedule_id,
+            "menu_cycle_name": full_report.menu_cycle_name,
+            "analysis_period": full_report.analysis_period,
+            "average_daily_food_groups": [
+                {
+                    "food_group": fg.food_group.value,
+                    "total_portions": fg.total_portions,
+                    "dishes_count": fg.dishes_count,
+                    "main_dishes": fg.main_dishes
+                }
+                for fg in full_report.average_daily_food_groups
+            ],
+            "food_group_diversity": len(full_report.average_daily_food_groups),
+            "recommendations": [
+                rec for rec in full_report.recommendations
+                if "food_groups" in NutritionalAnalysisService._recommendation_views(rec)
+            ]
+        }
+        
+        return food_group_analysis
+    
+    @staticmethod
+    def _macronutrient_distribution(nutrients: NutrientSummary) -> Dict[str, float]:
+        """Share of calories coming from each macronutrient, in percent"""
+        calories = nutrients.total_calories
+        if calories <= 0:
+            return {key: 0 for key, _, _ in NutritionalAnalysisService.MACRONUTRIENT_ENERGY}
+        scale = 100 / calories
+        return {
+            key: getattr(nutrients, field) * kcal_per_gram * scale
+            for key, field, kcal_per_gram in NutritionalAnalysisService.MACRONUTRIENT_ENERGY
+        }
+    
+    @staticmethod
+    async def get_nutrient_analysis(schedule_id: str) -> dict:
+        """Get the nutrient part of the nutritional report"""
+        
+        full_report = await NutritionalAnalysisService.generate_nutritional_report(schedule_id)
+        
+        # Extract nutrient information
+        nutrients = full_report.average_daily_nutrients
+        
+        nutrient_analysis = {
+            "menu_schedule_id": schedule_id,
+            "menu_cycle_name": full_report.menu_cycle_name,
+            "analysis_period": full_report.analysis_period,
+            "average_daily_nutrients": {
+                "calories": nutrients.total_calories,
+                "protein": nutrients.total_protein,
+                "carbohydrates": nutrients.total_carbohydrates,
+                "fat": nutrients.total_fat,
+                "fiber": nutrients.total_fiber,
+                "calcium": nutrients.total_calcium,
+                "iron": nutrients.total_iron,
+                "vitamin_c": nutrients.total_vitamin_c,
+                "vitamin_a": nutrients.total_vitamin_a
+            },
+            "macronutrient_distribution": NutritionalAnalysisService._macronutrient_distribution(nutrients),
+            "nutritional_adequacy_score": full_report.nutritional_adequacy_score,
+            "recommendations": [
+                rec for rec in full_report.recommendations
+                if "nutrients" in NutritionalAnalysisService._recommendation_views(rec)
+            ]
         }
         
-        requirements = requirements_data.get(age_group, requirements_data["school_age_6_12"])
+        return nutrient_analysis
+    
+    @staticmethod
+    async def compare_with_requirements(schedule_id: str, age_group: str = "school_age_6_12") -> NutritionalComparisonReport:
+        """Compare menu nutrition with standard requirements"""
+        
+        requirements = NutritionalAnalysisService.NUTRITIONAL_REQUIREMENTS.get(
+            age_group, NutritionalAnalysisService.NUTRITIONAL_REQUIREMENTS["school_age_6_12"]
+        )
         
         # Get actual intake
         full_report = await NutritionalAnalysisService.generate_nutritional_report(schedule_id)
         actual_intake = full_report.average_daily_nutrients
         
-        # Calculate compliance percentages
-        calorie_compliance = (actual_intake.total_calories / requirements.daily_calories) * 100
-        protein_compliance = (actual_intake.total_protein / requirements.daily_protein) * 100
-        calcium_compliance = (actual_intake.total_calcium / requirements.daily_calcium) * 100
-        iron_compliance = (actual_intake.total_iron / requirements.daily_iron) * 100
-        vitamin_c_compliance = (actual_intake.total_vitamin_c / requirements.daily_vitamin_c) * 100
-        vitamin_a_compliance = (actual_intake.total_vitamin_a / requirements.daily_vitamin_a) * 100
+        # Calculate compliance percentages in one pass over the compared nutrients;
+        # a nutrient without a requirement counts as 0% instead of dividing by zero
+        compliances = []
+        for actual_field, required_field, _ in NutritionalAnalysisService.COMPLIANCE_NUTRIENTS:
+            required = getattr(requirements, required_field)
+            compliances.append(getattr(actual_intake, actual_field) * 100 / required if required > 0 else 0.0)
+        (
+            calorie_compliance, protein_compliance, calcium_compliance,
+            iron_compliance, vitamin_c_compliance, vitamin_a_compliance
+        ) = compliances
         
         # Calculate overall compliance
-        overall_compliance = (
-            calorie_compliance + protein_compliance + calcium_compliance +
-            iron_compliance + vitamin_c_compliance + vitamin_a_compliance
-        ) / 6
+        overall_compliance = sum(compliances) / len(compliances)
         
         # Determine compliance status
-        if overall_compliance >= 90:
-            compliance_status = "excellent"
-        elif overall_compliance >= 80:
-            compliance_status = "good"
-        elif overall_compliance >= 70:
-            compliance_status = "fair"
-        else:
-            compliance_status = "poor"
+        compliance_status = NutritionalAnalysisService.COMPLIANCE_STATUSES[
+            bisect_right(NutritionalAnalysisService.COMPLIANCE_THRESHOLDS, overall_compliance)
+        ]
         
         # Generate improvement areas
-        improvement_areas = []
-        if calorie_compliance < 80:
-            improvement_areas.append("Energy/Calories")
-        if protein_compliance < 80:
-            improvement_areas.append("Protein")
-        if calcium_compliance < 80:
-            improvement_areas.append("Calcium")
-        if iron_compliance < 80:
-            improvement_areas.append("Iron")
-        if vitamin_c_compliance < 80:
-            improvement_areas.append("Vitamin C")
-        if vitamin_a_compliance < 80:
-            improvement_areas.append("Vitamin A")
+        improvement_areas = [
+            area
+            for (_, _, area), compliance in zip(NutritionalAnalysisService.COMPLIANCE_NUTRIENTS, compliances)
+            if compliance < 80
+        ]
         
         return NutritionalComparisonReport(
             menu_schedule_id=schedule_id,
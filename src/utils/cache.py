@@ -0,0 +1,85 @@
+"""
+In-process caching helpers.
+
+The service runs as a single uvicorn process, so a per-process cache that is
+cleared on writes stays consistent without an external cache server. With
+more processes, a write would only clear the caches of the one handling it;
+``require_single_worker`` refuses to start in that case.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+def require_single_worker(workers: int) -> None:
+    """
+    Refuse to start with more than one worker process.
+
+    Args:
+        workers: Requested worker count, i.e. WEB_CONCURRENCY, which uvicorn
+            and gunicorn use as their default
+
+    Raises:
+        RuntimeError: If more than one worker is requested
+    """
+    if workers > 1:
+        raise RuntimeError(
+            f"WEB_CONCURRENCY is {workers}, but response and report "
+            f"caches are per process and only cleared by writes in the same process; "
+            f"run a single worker"
+        )
+
+
+class TTLCache:
+    """
+    Small LRU cache whose entries expire after a time-to-live.
+
+    ``generation`` changes on every ``clear``. A value computed from data read
+    before a write can be stored with the generation captured at that point,
+    so it is dropped instead of outliving the write that cleared the cache.
+
+    Args:
+        ttl: Default lifetime of an entry in seconds
+        maxsize: Maximum number of entries kept; the least recently used
+            entry is evicted first
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl: Optional[float] = None, generation: Optional[int] = None
+    ) -> None:
+        if generation is not None and generation != self.generation:
+            # Cleared since the value was read; it may predate the write
+            return
+        lifetime = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + lifetime, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
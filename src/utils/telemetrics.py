@@ -12,13 +12,11 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from prometheus_client import REGISTRY, Counter, Gauge, Histogram
 from prometheus_client.openmetrics.exposition import (CONTENT_TYPE_LATEST,
                                                       generate_latest)
-from starlette.middleware.base import (BaseHTTPMiddleware,
-                                       RequestResponseEndpoint)
 from starlette.requests import Request
 from starlette.responses import Response
 from starlette.routing import Match
 from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 INFO = Gauge(
     "fastapi_app_info", "FastAPI application information.", [
@@ -50,32 +48,52 @@ REQUESTS_IN_PROGRESS = Gauge(
 )
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
+class PrometheusMiddleware:
+    """
+    Pure ASGI middleware recording request metrics.
+
+    It wraps ``send`` to capture the response status instead of going through
+    ``BaseHTTPMiddleware``, which adds a task group and a response stream per
+    request.
+    """
+
     def __init__(self, app: ASGIApp, app_name: str = "fastapi-app") -> None:
-        super().__init__(app)
+        self.app = app
         self.app_name = app_name
         INFO.labels(app_name=self.app_name).inc()
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        method = request.method
-        path, is_handled_path = self.get_path(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path, is_handled_path = self.get_path(scope)
 
         if not is_handled_path:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+
+        status_code = HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         REQUESTS_IN_PROGRESS.labels(
             method=method, path=path, app_name=self.app_name).inc()
         REQUESTS.labels(method=method, path=path, app_name=self.app_name).inc()
         before_time = time.perf_counter()
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except BaseException as e:
             status_code = HTTP_500_INTERNAL_SERVER_ERROR
             EXCEPTIONS.labels(method=method, path=path, exception_type=type(
                 e).__name__, app_name=self.app_name).inc()
             raise e from None
         else:
-            status_code = response.status_code
             after_time = time.perf_counter()
             # retrieve trace id for exemplar
             span = trace.get_current_span()
@@ -91,16 +109,14 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
             REQUESTS_IN_PROGRESS.labels(
                 method=method, path=path, app_name=self.app_name).dec()
 
-        return response
-
     @staticmethod
-    def get_path(request: Request) -> Tuple[str, bool]:
-        for route in request.app.routes:
-            match, child_scope = route.matches(request.scope)
+    def get_path(scope: Scope) -> Tuple[str, bool]:
+        for route in scope["app"].routes:
+            match, child_scope = route.matches(scope)
             if match == Match.FULL:
                 return route.path, True
 
-        return request.url.path, False
+        return scope["path"], False
 
 
 def metrics(request: Request) -> Response:
@@ -0,0 +1,15 @@
+import os
+
+# Settings without defaults, so modules reading core.config import without a .env
+for name, value in {
+    "ENV_STATE": "test",
+    "APP_NAME": "nutripae-menus-test",
+    "API_PREFIX_STR": "/api/v1",
+    "MODULE_IDENTIFIER": "nutripae-menus",
+    "NUTRIPAE_AUTH_HOST": "localhost",
+    "NUTRIPAE_AUTH_PORT": "8000",
+    "NUTRIPAE_COVERAGE_HOST": "localhost",
+    "NUTRIPAE_COVERAGE_PORT": "8000",
+    "OTLP_GRPC_ENDPOINT": "http://localhost:4317",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,74 @@
+import pytest
+
+from utils import cache as cache_module
+from utils.cache import TTLCache, require_single_worker
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic as seen by utils.cache"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    clock[0] += 9.9
+    assert cache.get("key") == "value"
+
+    clock[0] += 0.1
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2, ttl=100)
+
+    clock[0] += 50
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_set_with_stale_generation_is_dropped(clock):
+    cache = TTLCache(ttl=10)
+    generation = cache.generation
+
+    cache.clear()
+    cache.set("key", "read before the clear", generation=generation)
+    assert cache.get("key") is None
+
+    cache.set("key", "read after the clear", generation=cache.generation)
+    assert cache.get("key") == "read after the clear"
+
+
+def test_pop_returns_value_and_removes_it(clock):
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    assert cache.pop("key") == "value"
+    assert cache.pop("key", "missing") == "missing"
+
+
+def test_require_single_worker():
+    require_single_worker(1)
+    with pytest.raises(RuntimeError):
+        require_single_worker(2)
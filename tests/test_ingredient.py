@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("beanie")
+pytest.importorskip("pydantic_settings")
+
+from models.ingredient import Ingredient
+
+
+class FakeCollection:
+    """The part of a Motor collection ensure_name_lc_index touches"""
+
+    def __init__(self, missing_name_lc=0, indexes=None):
+        self.missing_name_lc = missing_name_lc
+        self.indexes = indexes or {}
+        self.dropped = []
+
+    async def count_documents(self, query, limit=0):
+        assert query == {"name_lc": None}
+        return self.missing_name_lc
+
+    async def index_information(self):
+        return dict(self.indexes)
+
+    async def drop_index(self, name):
+        self.dropped.append(name)
+        del self.indexes[name]
+
+    async def create_index(self, keys, name, unique):
+        self.indexes[name] = {"key": keys, "unique": unique}
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeCollection()
+    monkeypatch.setattr(Ingredient, "get_motor_collection", classmethod(lambda cls: fake))
+    return fake
+
+
+def test_missing_index_is_created_unique(collection):
+    asyncio.run(Ingredient.ensure_name_lc_index())
+
+    assert collection.indexes[Ingredient.NAME_LC_INDEX]["unique"] is True
+
+
+def test_unmigrated_names_refuse_startup(collection):
+    collection.missing_name_lc = 1
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(Ingredient.ensure_name_lc_index())
+    assert Ingredient.NAME_LC_INDEX not in collection.indexes
+
+
+def test_non_unique_index_is_not_dropped_at_startup(collection):
+    collection.indexes[Ingredient.NAME_LC_INDEX] = {"unique": False}
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(Ingredient.ensure_name_lc_index())
+    assert collection.dropped == []
+
+
+def test_migration_rebuilds_non_unique_index(collection):
+    collection.indexes[Ingredient.NAME_LC_INDEX] = {"unique": False}
+
+    asyncio.run(Ingredient.ensure_name_lc_index(replace_non_unique=True))
+
+    assert collection.dropped == [Ingredient.NAME_LC_INDEX]
+    assert collection.indexes[Ingredient.NAME_LC_INDEX]["unique"] is True
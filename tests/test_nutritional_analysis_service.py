@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("beanie")
+pytest.importorskip("pydantic_settings")
+
+from services import nutritional_analysis_service as service_module
+from services.nutritional_analysis_service import NutritionalAnalysisService
+
+SCHEDULE_ID = "665f1c2e9b1e8a3d4c5b6a70"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    """
+    Stand-in for the schedule and menu cycle collections.
+
+    `_compute_report` returns the schedule version it was given and, while
+    `gate` is set, waits for it, so a test can write during a build.
+    """
+    state = SimpleNamespace(version=1, gate=None, computed=0)
+    schedule = SimpleNamespace(menu_cycle_id="cycle", status="active")
+    menu_cycle = SimpleNamespace(id="cycle", updated_at=datetime(2026, 1, 1))
+
+    async def get_schedule(_schedule_id):
+        schedule.updated_at = datetime(2026, 1, state.version)
+        return schedule
+
+    async def get_menu_cycle(_cycle_id):
+        return menu_cycle
+
+    async def compute_report(_schedule_id, loaded_schedule, _menu_cycle):
+        version = loaded_schedule.updated_at.day
+        state.computed += 1
+        if state.gate is not None:
+            await state.gate.wait()
+        return f"report v{version}"
+
+    async def wait_for_builds(count):
+        while state.computed < count:
+            await asyncio.sleep(0)
+
+    state.wait_for_builds = wait_for_builds
+    monkeypatch.setattr(service_module.MenuSchedule, "get", get_schedule)
+    monkeypatch.setattr(service_module.MenuCycle, "get", get_menu_cycle)
+    monkeypatch.setattr(NutritionalAnalysisService, "_compute_report", staticmethod(compute_report))
+    NutritionalAnalysisService.clear_report_cache()
+    yield state
+    NutritionalAnalysisService.clear_report_cache()
+
+
+def test_concurrent_requests_share_one_build(store):
+    async def run():
+        return await asyncio.gather(
+            NutritionalAnalysisService.generate_nutritional_report(SCHEDULE_ID),
+            NutritionalAnalysisService.generate_nutritional_report(SCHEDULE_ID),
+        )
+
+    assert asyncio.run(run()) == ["report v1", "report v1"]
+    assert store.computed == 1
+
+
+def test_write_during_build_does_not_cache_stale_report(store):
+    async def run():
+        store.gate = asyncio.Event()
+        stale_build = asyncio.ensure_future(
+            NutritionalAnalysisService.generate_nutritional_report(SCHEDULE_ID)
+        )
+        await store.wait_for_builds(1)
+
+        # The schedule is written while its old version is being analysed
+        store.version = 2
+        NutritionalAnalysisService.forget_schedule_report(SCHEDULE_ID)
+
+        # A caller after the write starts its own build instead of joining the stale one
+        fresh_build = asyncio.ensure_future(
+            NutritionalAnalysisService.generate_nutritional_report(SCHEDULE_ID)
+        )
+        await store.wait_for_builds(2)
+        store.gate.set()
+        stale_report, fresh_report = await asyncio.gather(stale_build, fresh_build)
+
+        store.gate = None
+        cached_report = await NutritionalAnalysisService.generate_nutritional_report(SCHEDULE_ID)
+        return stale_report, fresh_report, cached_report
+
+    stale_report, fresh_report, cached_report = asyncio.run(run())
+
+    assert stale_report == "report v1"
+    assert fresh_report == "report v2"
+    assert cached_report == "report v2"
+    assert store.computed == 2
+
+
+def test_cache_clear_during_build_does_not_cache_stale_report(store):
+    async def run():
+        store.gate = asyncio.Event()
+        build = asyncio.ensure_future(
+            NutritionalAnalysisService.generate_nutritional_report(SCHEDULE_ID)
+        )
+        await store.wait_for_builds(1)
+        NutritionalAnalysisService.clear_report_cache()
+        store.gate.set()
+        await build
+
+        store.gate = None
+        return await NutritionalAnalysisService.generate_nutritional_report(SCHEDULE_ID)
+
+    assert asyncio.run(run()) == "report v1"
+    # Nothing from the build that overlapped the clear was cached
+    assert store.computed == 2
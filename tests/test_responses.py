@@ -0,0 +1,106 @@
+import asyncio
+from functools import partial
+
+import pytest
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from core import responses
+from core.responses import etag_response, stream_models, tag_body, version_tag
+from utils.cache import TTLCache
+
+
+class Item(BaseModel):
+    value: int
+
+
+def make_request(if_none_match=None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+async def read_body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+TAGGED_BODY = tag_body(b'{"value":1}')
+ETAG = TAGGED_BODY[1]
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [ETAG, f"W/{ETAG}", f'"other", {ETAG}', "*"],
+    ids=["strong", "weak", "list", "wildcard"],
+)
+def test_matching_etag_gets_304(if_none_match):
+    response = etag_response(TAGGED_BODY, make_request(if_none_match))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == ETAG
+
+
+@pytest.mark.parametrize("if_none_match", [None, '"other"', 'W/"other"'])
+def test_other_etag_gets_body(if_none_match):
+    response = etag_response(TAGGED_BODY, make_request(if_none_match))
+
+    assert response.status_code == 200
+    assert response.body == TAGGED_BODY[0]
+    assert response.headers["etag"] == ETAG
+
+
+def test_version_tag_changes_with_versions():
+    assert version_tag("id", 1) == version_tag("id", 1)
+    assert version_tag("id", 1) != version_tag("id", 2)
+
+
+async def items(count: int):
+    for value in range(count):
+        yield Item(value=value)
+
+
+def test_stream_caches_complete_body():
+    cache = TTLCache(ttl=10)
+
+    async def run():
+        response = await stream_models(
+            items(3), Item, on_complete=partial(cache.set, "key", generation=cache.generation)
+        )
+        return await read_body(response)
+
+    body = asyncio.run(run())
+
+    assert body == b'[{"value":0},{"value":1},{"value":2}]'
+    assert cache.get("key") == body
+
+
+def test_write_during_stream_does_not_repopulate_cache(monkeypatch):
+    # Small chunks, so the stream is still running after the first one is sent
+    monkeypatch.setattr(responses, "STREAM_CHUNK_SIZE", 1)
+    cache = TTLCache(ttl=10)
+
+    async def run():
+        response = await stream_models(
+            items(3), Item, on_complete=partial(cache.set, "key", generation=cache.generation)
+        )
+        chunks = response.body_iterator
+        first_chunk = await anext(chunks)
+        # A write lands while the list is streaming
+        cache.clear()
+        return first_chunk + b"".join([chunk async for chunk in chunks])
+
+    body = asyncio.run(run())
+
+    assert body == b'[{"value":0},{"value":1},{"value":2}]'
+    assert cache.get("key") is None
+
+
+def test_cursor_error_before_first_chunk_is_raised():
+    async def failing_items():
+        raise RuntimeError("cursor failed")
+        yield
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(stream_models(failing_items(), Item))